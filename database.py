@@ -10,11 +10,54 @@ All tables include extensive extra attributes and a 'meta_data' JSON column for
 import sqlite3
 import json
 import hashlib
+import logging
 import os
+import threading
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Iterator, Sequence
 from contextlib import contextmanager
 
+logger = logging.getLogger(__name__)
+
+# Maximum number of ids bound into a single "IN (...)" clause
+# (kept below SQLite's default limit of 999 host parameters)
+SQL_IN_BATCH_SIZE = 900
+
+# Recomputes product_summary rows from products and product_variations;
+# {where} narrows it to the products a sync trigger touched
+PRODUCT_SUMMARY_REFRESH = """
+INSERT OR REPLACE INTO product_summary (
+    product_id, name, sku, barcode, image_path,
+    min_price, max_price, display_price,
+    variation_count, in_stock_variations, total_stock,
+    variation_codes, active, updated_at
+)
+SELECT 
+    p.id, p.name, p.sku, p.barcode, p.image_path,
+    MIN(pv.price), MAX(pv.price),
+    CASE
+        WHEN p.type = 'variable' AND COUNT(pv.id) > 0 AND MIN(pv.price) = MAX(pv.price)
+            THEN printf('$%.2f', MIN(pv.price))
+        WHEN p.type = 'variable' AND COUNT(pv.id) > 0
+            THEN printf('$%.2f - $%.2f', MIN(pv.price), MAX(pv.price))
+        WHEN p.price IS NOT NULL THEN printf('$%.2f', p.price)
+        ELSE 'N/A'
+    END,
+    COUNT(pv.id),
+    COALESCE(SUM(CASE WHEN pv.stock_quantity > 0 THEN 1 ELSE 0 END), 0),
+    COALESCE(SUM(pv.stock_quantity), p.stock_quantity),
+    GROUP_CONCAT(COALESCE(pv.sku, '') || ' ' || COALESCE(pv.barcode, ''), ' '),
+    p.is_active,
+    CURRENT_TIMESTAMP
+FROM products p
+LEFT JOIN product_variations pv ON p.id = pv.product_id AND pv.is_active = 1
+{where}
+GROUP BY p.id
+"""
+
+# Number of write transactions between passive WAL checkpoints
+WAL_CHECKPOINT_INTERVAL = 500
+
 
 class DatabaseManager:
     """Main database manager for Twinx POS system."""
@@ -26,23 +69,81 @@ class DatabaseManager:
             db_path: Path to SQLite database file
         """
         self.db_path = db_path
+        self._wal_enabled = False
+        self.fts_enabled = False
+        self._write_commits = 0
+        # Pool workers commit too, so the counter is updated under a lock
+        self._commit_lock = threading.Lock()
+        # GUI thread connection reused for reads (see _read_connection)
+        self._read_conn: Optional[sqlite3.Connection] = None
         self.init_db()
     
     @contextmanager
     def get_connection(self):
         """Context manager for database connections with proper cleanup."""
         conn = sqlite3.connect(self.db_path)
-        conn.execute("PRAGMA foreign_keys = ON")
+        
+        # journal_mode is stored in the database file, so it only needs
+        # to be switched once; the remaining pragmas are per connection
+        if not self._wal_enabled:
+            conn.execute("PRAGMA journal_mode = WAL")
+            self._wal_enabled = True
+        self._configure_connection(conn)
         conn.row_factory = sqlite3.Row
         try:
             yield conn
             conn.commit()
+            if conn.total_changes:
+                self._after_write_commit(conn)
         except Exception as e:
             conn.rollback()
             raise e
         finally:
             conn.close()
     
+    def _configure_connection(self, conn):
+        """Apply the per-connection pragmas."""
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA cache_size = -65536")  # 64 MiB
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA mmap_size = 268435456")  # 256 MiB
+        conn.execute("PRAGMA foreign_keys = ON")
+    
+    def _read_connection(self, query: str) -> Optional[sqlite3.Connection]:
+        """Return the GUI thread's long-lived connection for a SELECT.
+        
+        Reusing one connection keeps sqlite3's prepared-statement cache
+        warm, so repeated queries skip connect, pragma setup and SQL parsing.
+        Pool threads and anything that is not a plain SELECT get None and
+        use get_connection as before, so writes keep their own transaction.
+        """
+        if threading.current_thread() is not threading.main_thread():
+            return None
+        if query.lstrip()[:6].upper() != 'SELECT':
+            return None
+        if self._read_conn is None:
+            self._read_conn = sqlite3.connect(self.db_path, cached_statements=256)
+            self._configure_connection(self._read_conn)
+        return self._read_conn
+    
+    def close(self):
+        """Close the reused read connection; call on application exit."""
+        if self._read_conn is not None:
+            self._read_conn.close()
+            self._read_conn = None
+    
+    def _after_write_commit(self, conn):
+        """Count write transactions and checkpoint the WAL periodically.
+        
+        A passive checkpoint copies what it can back into the database file
+        without waiting on readers, keeping the WAL from growing unbounded.
+        """
+        with self._commit_lock:
+            self._write_commits += 1
+            checkpoint = self._write_commits % WAL_CHECKPOINT_INTERVAL == 0
+        if checkpoint:
+            conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+    
     def init_db(self):
         """Initialize the database with all tables and default data."""
         with self.get_connection() as conn:
@@ -61,6 +162,12 @@ class DatabaseManager:
             self._create_financial_tables(cursor)
             self._create_system_tables(cursor)
             
+            # Full-text index for product search
+            self._create_search_index(cursor)
+            
+            # Create indexes for hot query paths
+            self._create_indexes(cursor)
+            
             # Insert default admin user
             self._insert_default_admin(cursor)
             
@@ -308,6 +415,102 @@ class DatabaseManager:
             FOREIGN KEY (parent_id) REFERENCES categories(id)
         )
         """)
+        
+        # Product summary - denormalized listing data, one row per product,
+        # kept current by the triggers from _create_summary_triggers
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS product_summary (
+            product_id INTEGER PRIMARY KEY,
+            name TEXT,
+            sku TEXT,
+            barcode TEXT,
+            image_path TEXT,
+            min_price DECIMAL(10,2),  -- Lowest active variation price
+            max_price DECIMAL(10,2),  -- Highest active variation price
+            display_price TEXT,  -- Formatted price or price range
+            variation_count INTEGER DEFAULT 0,
+            in_stock_variations INTEGER DEFAULT 0,
+            total_stock INTEGER DEFAULT 0,
+            variation_codes TEXT,  -- Active variation SKUs/barcodes for search
+            active BOOLEAN DEFAULT 1,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (product_id) REFERENCES products(id) ON DELETE CASCADE
+        )
+        """)
+        
+        self._create_summary_triggers(cursor)
+    
+    def _create_summary_triggers(self, cursor):
+        """Create the triggers that keep product_summary in sync.
+        
+        Every insert, delete and relevant update on products or
+        product_variations recomputes the affected product's summary row,
+        so no writer has to refresh it by hand. The first time the triggers
+        are created (new table, or a database from before them) the whole
+        table is rebuilt.
+        """
+        cursor.execute("""
+        SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'product_summary_pv_au'
+        """)
+        is_new = cursor.fetchone() is None
+        
+        def refresh(product_ids):
+            return PRODUCT_SUMMARY_REFRESH.format(where=f"WHERE p.id IN ({product_ids})")
+        
+        cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS product_summary_p_ai AFTER INSERT ON products BEGIN
+            {refresh('new.id')};
+        END
+        """)
+        
+        cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS product_summary_p_ad AFTER DELETE ON products BEGIN
+            DELETE FROM product_summary WHERE product_id = old.id;
+        END
+        """)
+        
+        # Only the columns product_summary shows; other edits skip the refresh
+        cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS product_summary_p_au
+        AFTER UPDATE OF name, sku, barcode, image_path, type, price, stock_quantity, is_active
+        ON products BEGIN
+            {refresh('new.id')};
+        END
+        """)
+        
+        cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS product_summary_pv_ai AFTER INSERT ON product_variations BEGIN
+            {refresh('new.product_id')};
+        END
+        """)
+        
+        cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS product_summary_pv_ad AFTER DELETE ON product_variations BEGIN
+            {refresh('old.product_id')};
+        END
+        """)
+        
+        cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS product_summary_pv_au
+        AFTER UPDATE OF product_id, sku, barcode, price, stock_quantity, is_active
+        ON product_variations BEGIN
+            {refresh('old.product_id, new.product_id')};
+        END
+        """)
+        
+        if is_new:
+            self.refresh_product_summary(cursor)
+    
+    def refresh_product_summary(self, cursor):
+        """Rebuild every product_summary row from products and product_variations.
+        
+        The triggers keep rows current; this is only needed to backfill.
+        
+        Args:
+            cursor: Cursor inside the caller's transaction
+        """
+        cursor.execute("DELETE FROM product_summary")
+        cursor.execute(PRODUCT_SUMMARY_REFRESH.format(where=""))
     
     def _create_hr_tables(self, cursor):
         """Create HR and employee management tables."""
@@ -2658,6 +2861,118 @@ class DatabaseManager:
         )
         """)
     
+    def _create_indexes(self, cursor):
+        """Create indexes used by the product search and low-stock queries."""
+        
+        # Variation lookups by parent (search joins, low-stock, stock totals)
+        cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_pv_product_active
+        ON product_variations(product_id, is_active, stock_quantity)
+        """)
+        
+        # Active product listing ordered by name
+        cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_products_active_name
+        ON products(is_active, name)
+        """)
+        
+        # Product listing in name order, and exact barcode / category lookups
+        cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_product_summary_name
+        ON product_summary(active, name)
+        """)
+        
+        cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_products_barcode
+        ON products(barcode)
+        """)
+        
+        cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_products_category
+        ON products(category, is_active)
+        """)
+        
+        # Low-stock scans over variations
+        cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_pv_low_stock
+        ON product_variations(is_active, stock_quantity, low_stock_threshold)
+        """)
+        
+        # Covers the product screen stats counters (active products by
+        # type and stock); idx_pv_product_active covers their variation side
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'idx_products_active_stock'")
+        stats_index_is_new = cursor.fetchone() is None
+        cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_products_active_stock
+        ON products(is_active, stock_quantity, type)
+        """)
+        
+        # Collect planner statistics the first time; afterwards let SQLite
+        # decide whether they need refreshing
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'")
+        if cursor.fetchone() is None:
+            cursor.execute("ANALYZE")
+        else:
+            if stats_index_is_new:
+                cursor.execute("ANALYZE idx_products_active_stock")
+            cursor.execute("PRAGMA optimize")
+    
+    def _create_search_index(self, cursor):
+        """Create the FTS5 index used by product search.
+        
+        products_fts is an external-content table over products, kept in
+        sync by triggers. It uses the trigram tokenizer, so a MATCH finds a
+        term anywhere inside a value (mid-string SKU and barcode fragments
+        included), like the LIKE '%term%' search it replaces. If the SQLite
+        build lacks FTS5 or trigram, fts_enabled stays False and search
+        falls back to LIKE matching.
+        """
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'products_fts'")
+        is_new = cursor.fetchone() is None
+        
+        try:
+            cursor.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS products_fts USING fts5(
+                name, sku, barcode, brand, description,
+                content='products', content_rowid='id',
+                tokenize='trigram'
+            )
+            """)
+        except sqlite3.OperationalError as e:
+            logger.warning("Full-text search unavailable: %s", e)
+            return
+        
+        cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS products_fts_ai AFTER INSERT ON products BEGIN
+            INSERT INTO products_fts(rowid, name, sku, barcode, brand, description)
+            VALUES (new.id, new.name, new.sku, new.barcode, new.brand, new.description);
+        END
+        """)
+        
+        cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS products_fts_ad AFTER DELETE ON products BEGIN
+            INSERT INTO products_fts(products_fts, rowid, name, sku, barcode, brand, description)
+            VALUES ('delete', old.id, old.name, old.sku, old.barcode, old.brand, old.description);
+        END
+        """)
+        
+        # Only re-index when a searchable column changes, not on stock updates
+        cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS products_fts_au
+        AFTER UPDATE OF name, sku, barcode, brand, description ON products BEGIN
+            INSERT INTO products_fts(products_fts, rowid, name, sku, barcode, brand, description)
+            VALUES ('delete', old.id, old.name, old.sku, old.barcode, old.brand, old.description);
+            INSERT INTO products_fts(rowid, name, sku, barcode, brand, description)
+            VALUES (new.id, new.name, new.sku, new.barcode, new.brand, new.description);
+        END
+        """)
+        
+        # Index rows that existed before the FTS table was added
+        if is_new:
+            cursor.execute("INSERT INTO products_fts(products_fts) VALUES ('rebuild')")
+        
+        self.fts_enabled = True
+    
     def _insert_default_admin(self, cursor):
         """Insert default admin user."""
         
@@ -2770,7 +3085,7 @@ class DatabaseManager:
             VALUES (?, ?, ?, ?, ?)
             """, (key, value, group, category, key.replace('_', ' ').title()))
     
-    def execute_query(self, query: str, params: tuple = ()) -> List[Dict]:
+    def execute_query(self, query: str, params: Sequence[Any] = ()) -> List[Dict]:
         """Execute a query and return results as dictionaries.
         
         Args:
@@ -2780,12 +3095,71 @@ class DatabaseManager:
         Returns:
             List of dictionaries representing rows
         """
+        conn = self._read_connection(query)
+        if conn is None:
+            with self.get_connection() as conn:
+                return self._fetch_dicts(conn, query, params)
+        return self._fetch_dicts(conn, query, params)
+    
+    def _fetch_dicts(self, conn: sqlite3.Connection, query: str,
+                     params: Sequence[Any]) -> List[Dict]:
+        """Run a query on conn and build one dict per row."""
+        # Plain tuples + one shared column-name tuple is cheaper than
+        # building each dict from an sqlite3.Row
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        cursor.execute(query, params)
+        if cursor.description is None:
+            return []
+        columns = tuple(column[0] for column in cursor.description)
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+    
+    def execute_query_tuples(self, query: str, params: Sequence[Any] = ()) -> List[tuple]:
+        """Execute a read query and return rows as plain tuples.
+        
+        Use this instead of execute_query when the caller unpacks columns by
+        position, so no dict is built per row.
+        
+        Args:
+            query: SQL query string
+            params: Query parameters
+            
+        Returns:
+            List of row tuples in SELECT column order
+        """
+        conn = self._read_connection(query)
+        if conn is None:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.row_factory = None
+                return cursor.execute(query, params).fetchall()
+        return conn.execute(query, params).fetchall()
+    
+    def iter_query_batches(self, query: str, params: Sequence[Any] = (),
+                           batch_size: int = 1000) -> Iterator[List[sqlite3.Row]]:
+        """Execute a query and yield its rows in fetchmany batches.
+        
+        Unlike execute_query, the result set is never materialized, so memory
+        use stays flat for large exports. The connection stays open until the
+        iterator is exhausted or closed.
+        
+        Args:
+            query: SQL query string
+            params: Query parameters
+            batch_size: Rows fetched per batch
+            
+        Yields:
+            Lists of sqlite3.Row objects (indexable by position or column name)
+        """
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(query, params)
-            return [dict(row) for row in cursor.fetchall()]
+            cursor = conn.execute(query, params)
+            while True:
+                batch = cursor.fetchmany(batch_size)
+                if not batch:
+                    break
+                yield batch
     
-    def execute_update(self, query: str, params: tuple = ()) -> int:
+    def execute_update(self, query: str, params: Sequence[Any] = ()) -> int:
         """Execute an update/insert query and return affected row count.
         
         Args:
@@ -154,6 +154,8 @@ class ApplicationController:
             # Initialize database
             print("Initializing database...")
             self.db_manager = DatabaseManager("twinx_pos.db")
+            # Close the reused read connection when the event loop exits
+            self.app.aboutToQuit.connect(self.db_manager.close)
             
             # Initialize config manager
             print("Initializing config manager...")
@@ -7,15 +7,102 @@ This module handles product management, variations, attributes, and stock moveme
 """
 
 import json
+import logging
+import re
+import secrets
+import time
+from collections import defaultdict
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple, Callable
 from decimal import Decimal
-from database import DatabaseManager
+from database import DatabaseManager, SQL_IN_BATCH_SIZE
+
+logger = logging.getLogger(__name__)
+
+# orjson parses small JSON documents several times faster than the stdlib;
+# fall back to json when it is not installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# stock_movements.warehouse_id is NOT NULL; the POS tracks a single
+# location, so movements are recorded against this warehouse
+DEFAULT_WAREHOUSE_ID = 1
+
+# Low stock, shared by get_low_stock_products, the 'low_stock' search
+# filter and the product screen stats: a simple product at or under its
+# threshold, or any product with an active variation at or under the
+# variation's threshold. Both ? take a threshold that overrides the stored
+# ones (None = use the stored thresholds, defaulting to 5).
+LOW_STOCK_CONDITION = """(
+    (p.type = 'simple' AND p.stock_quantity <= COALESCE(?, p.low_stock_threshold, 5))
+    OR p.id IN (
+        SELECT pv.product_id FROM product_variations pv
+        WHERE pv.is_active = 1
+        AND pv.stock_quantity <= COALESCE(?, pv.low_stock_threshold, 5)
+    )
+)"""
+
+# Row written by _log_audit_event; module doubles as entity_type for now
+AUDIT_LOG_QUERY = """
+INSERT INTO audit_logs 
+(user_id, action_type, module, entity_type, entity_id, change_summary, status, action_timestamp)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Seconds a search_products total count is reused for the same filters
+SEARCH_COUNT_CACHE_TTL = 30
+
+# Slug patterns, compiled once
+_SLUG_NON_ALNUM = re.compile(r'[^a-z0-9]+')
+_SLUG_TRIM = re.compile(r'^-+|-+$')
+
+
+@lru_cache(maxsize=128)
+def _build_update_sql(fields: Tuple[str, ...]) -> str:
+    """Build the products UPDATE statement for a given set of fields."""
+    assignments = [f"{field} = ?" for field in fields]
+    assignments.append("updated_at = ?")
+    return f"""
+    UPDATE products 
+    SET {', '.join(assignments)}
+    WHERE id = ?
+    """
+
+
+# Shortest search word the trigram index can match; shorter words use LIKE
+FTS_MIN_TERM_LENGTH = 3
+
+
+def _escape_like(text: str) -> str:
+    """Escape LIKE wildcards in text, for use with ESCAPE '\\'."""
+    return text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+def _like_pattern(word: str) -> str:
+    """Return a LIKE pattern matching word anywhere, with wildcards escaped."""
+    return f"%{_escape_like(word)}%"
 
 
 class ProductController:
     """Handles product management, variations, attributes, and stock control."""
     
+    # Fields update_product is allowed to change
+    UPDATE_ALLOWED_FIELDS = (
+        'name', 'category', 'subcategory', 'brand', 'description',
+        'short_description', 'price', 'cost_price', 'wholesale_price',
+        'suggested_retail_price', 'tax_class', 'tax_rate', 'sku',
+        'barcode', 'weight_kg', 'length_cm', 'width_cm', 'height_cm',
+        'manufacturer', 'country_of_origin', 'warranty_period_months',
+        'has_warranty', 'support_email', 'support_phone',
+        'min_order_quantity', 'max_order_quantity', 'is_active',
+        'is_featured', 'stock_quantity', 'low_stock_threshold',
+        'updated_by'
+    )
+    
     def __init__(self, db_manager: DatabaseManager):
         """
         Initialize ProductController with database connection.
@@ -24,6 +111,10 @@ class ProductController:
             db_manager: Instance of DatabaseManager
         """
         self.db = db_manager
+        
+        # search_products totals: (query, category, brand, in_stock) -> (time, count);
+        # cleared whenever products or stock change
+        self._count_cache: Dict[tuple, Tuple[float, int]] = {}
     
     def create_product(self, product_data: Dict[str, Any], 
                       variations: List[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -108,7 +199,7 @@ class ProductController:
                 VALUES ({', '.join(placeholders)})
                 """
                 
-                cursor.execute(query, tuple(values))
+                cursor.execute(query, values)
                 product_id = cursor.lastrowid
                 
                 # Handle variations if product type is 'variable'
@@ -120,19 +211,22 @@ class ProductController:
                 if 'attributes' in product_data:
                     self._link_product_attributes(cursor, product_id, product_data['attributes'])
                 
-                # Commit transaction
-                conn.commit()
+                self._invalidate_search_counts()
                 
-                # Log audit event
+                # Log audit event in the same transaction
                 self._log_audit_event(
                     user_id=product_data.get('created_by'),
                     action='create',
                     entity_type='products',
                     entity_id=product_id,
                     details=f'Created product {product_id}: {product_data["name"]}',
-                    status='success'
+                    status='success',
+                    cursor=cursor
                 )
                 
+                # Commit transaction
+                conn.commit()
+                
                 return {
                     'success': True,
                     'message': 'Product created successfully',
@@ -208,9 +302,23 @@ class ProductController:
         VALUES ({', '.join(placeholders)})
         """
         
-        cursor.execute(query, tuple(values))
+        cursor.execute(query, values)
         return cursor.lastrowid
     
+    def _parse_attribute_combination(self, variation: Dict[str, Any]) -> None:
+        """
+        Decode a variation's attribute_combination JSON in place.
+        
+        Args:
+            variation: Variation row; empty values are left untouched and
+                invalid JSON becomes an empty dict
+        """
+        if raw := variation.get('attribute_combination'):
+            try:
+                variation['attribute_combination'] = _json_loads(raw)
+            except ValueError:  # also covers orjson.JSONDecodeError
+                variation['attribute_combination'] = {}
+    
     def _link_product_attributes(self, cursor, product_id: int, attributes_data: List[Dict[str, Any]]) -> None:
         """
         Link attributes to product.
@@ -338,7 +446,7 @@ class ProductController:
                     'variations': []
                 }
             
-            product = dict(product_result[0])
+            product = product_result[0]
             
             # Parse JSON fields
             json_fields = ['image_gallery', 'tags', 'meta_data']
@@ -356,20 +464,11 @@ class ProductController:
             ORDER BY is_default_variation DESC, id ASC
             """
             
-            variations_result = self.db.execute_query(variations_query, (product_id,))
-            variations = []
+            variations = self.db.execute_query(variations_query, (product_id,))
             
-            for var in variations_result:
-                variation = dict(var)
-                
+            for variation in variations:
                 # Parse attribute combination JSON
-                if variation.get('attribute_combination'):
-                    try:
-                        variation['attribute_combination'] = json.loads(variation['attribute_combination'])
-                    except:
-                        variation['attribute_combination'] = {}
-                
-                variations.append(variation)
+                self._parse_attribute_combination(variation)
             
             # Get product attributes
             attributes_query = """
@@ -383,8 +482,7 @@ class ProductController:
             ORDER BY a.sort_order, at.sort_order
             """
             
-            attributes_result = self.db.execute_query(attributes_query, (product_id,))
-            attributes = [dict(attr) for attr in attributes_result]
+            attributes = self.db.execute_query(attributes_query, (product_id,))
             
             # Group attributes by name for easier display
             grouped_attributes = {}
@@ -416,7 +514,7 @@ class ProductController:
             """
             
             stock_result = self.db.execute_query(stock_query, (product_id,))
-            stock_summary = dict(stock_result[0]) if stock_result else {}
+            stock_summary = stock_result[0] if stock_result else {}
             
             # Get recent stock movements
             movements_query = """
@@ -428,8 +526,7 @@ class ProductController:
             LIMIT 10
             """
             
-            movements_result = self.db.execute_query(movements_query, (product_id,))
-            recent_movements = [dict(mov) for mov in movements_result]
+            recent_movements = self.db.execute_query(movements_query, (product_id,))
             
             return {
                 'success': True,
@@ -524,6 +621,7 @@ class ProductController:
                 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """
                 
+                current_time = datetime.now()
                 movement_data = (
                     variation['product_id'], variation_id,
                     variation['product_name'], variation['product_sku'],
@@ -531,7 +629,7 @@ class ProductController:
                     abs(qty_change), current_stock, new_stock,
                     reference_type, reference_id, reason,
                     batch_number, user_id, notes,
-                    datetime.now(), datetime.now(), datetime.now()
+                    current_time, current_time, current_time
                 )
                 
                 cursor.execute(movement_query, movement_data)
@@ -544,7 +642,7 @@ class ProductController:
                 WHERE id = ?
                 """
                 
-                cursor.execute(update_query, (new_stock, datetime.now(), variation_id))
+                cursor.execute(update_query, (new_stock, current_time, variation_id))
                 
                 # Update parent product stock if it manages stock
                 if variation.get('manage_stock', True):
@@ -571,22 +669,25 @@ class ProductController:
                     """
                     
                     cursor.execute(product_update_query, (
-                        total_stock, stock_status, datetime.now(), variation['product_id']
+                        total_stock, stock_status, current_time, variation['product_id']
                     ))
                 
-                # Commit transaction
-                conn.commit()
+                self._invalidate_search_counts()
                 
-                # Log audit event
+                # Log audit event in the same transaction
                 self._log_audit_event(
                     user_id=user_id,
                     action='update',
                     entity_type='stock_movements',
                     entity_id=movement_id,
                     details=f'Stock updated for variation {variation_id}: {qty_change} ({reason})',
-                    status='success'
+                    status='success',
+                    cursor=cursor
                 )
                 
+                # Commit transaction
+                conn.commit()
+                
                 return {
                     'success': True,
                     'message': 'Stock updated successfully',
@@ -659,7 +760,10 @@ class ProductController:
     
     def search_products(self, query: str = "", category_id: int = None, 
                        brand: str = None, in_stock_only: bool = False,
-                       limit: int = 50, offset: int = 0) -> Dict[str, Any]:
+                       limit: int = 50, offset: int = 0,
+                       with_total: bool = True,
+                       stock_filter: str = None,
+                       product_id: int = None) -> Dict[str, Any]:
         """
         Search products by name, SKU, or barcode.
         
@@ -670,23 +774,49 @@ class ProductController:
             in_stock_only: Only show products in stock
             limit: Maximum results to return
             offset: Results offset for pagination
+            with_total: Count all matches; when False total_count is None
+                and only has_more is reported
+            stock_filter: 'in_stock', 'low_stock' or 'out_of_stock' (optional)
+            product_id: Only return this product, if it matches the other
+                filters (optional)
             
         Returns:
             Dictionary with search results
         """
         try:
-            # Prepare search conditions
-            conditions = ["p.is_active = 1"]
+            # Listing data (price range, stock totals, variation counts) comes
+            # from the denormalized product_summary table, so no aggregation
+            # over product_variations is needed per request
+            conditions = ["ps.active = 1"]
             params = []
+            # Whether any filter reads a column that only products has
+            needs_products = bool(category_id or brand or in_stock_only
+                                  or stock_filter in ('in_stock', 'low_stock'))
             
             if query:
-                # Search in name, SKU, barcode, description
-                conditions.append("""
-                (p.name LIKE ? OR p.sku LIKE ? OR p.barcode LIKE ? 
-                 OR p.description LIKE ? OR pv.sku LIKE ? OR pv.barcode LIKE ?)
-                """)
-                search_term = f"%{query}%"
-                params.extend([search_term] * 6)
+                # Every word must appear, anywhere, in the name, SKU, barcode,
+                # brand, description or a variation code; matching is by
+                # substring so mid-string code fragments are found
+                for word in query.split():
+                    like_term = _like_pattern(word)
+                    if self.db.fts_enabled and len(word) >= FTS_MIN_TERM_LENGTH:
+                        conditions.append("""
+                        (ps.product_id IN (SELECT rowid FROM products_fts WHERE products_fts MATCH ?)
+                         OR ps.variation_codes LIKE ? ESCAPE '\\')
+                        """)
+                        params.extend(['"' + word.replace('"', '""') + '"', like_term])
+                    else:
+                        conditions.append("""
+                        (ps.name LIKE ? ESCAPE '\\' OR ps.sku LIKE ? ESCAPE '\\'
+                         OR ps.barcode LIKE ? ESCAPE '\\' OR p.brand LIKE ? ESCAPE '\\'
+                         OR p.description LIKE ? ESCAPE '\\' OR ps.variation_codes LIKE ? ESCAPE '\\')
+                        """)
+                        params.extend([like_term] * 6)
+                        needs_products = True
+            
+            if product_id:
+                conditions.append("ps.product_id = ?")
+                params.append(product_id)
             
             if category_id:
                 conditions.append("p.category = ?")
@@ -696,95 +826,102 @@ class ProductController:
                 conditions.append("p.brand = ?")
                 params.append(brand)
             
-            if in_stock_only:
-                conditions.append("""
-                (p.stock_status = 'instock' OR 
-                 (SELECT COUNT(*) FROM product_variations pv2 
-                  WHERE pv2.product_id = p.id AND pv2.stock_quantity > 0) > 0)
-                """)
+            if in_stock_only or stock_filter == 'in_stock':
+                conditions.append("(p.stock_status = 'instock' OR ps.in_stock_variations > 0)")
+            elif stock_filter == 'low_stock':
+                conditions.append(LOW_STOCK_CONDITION)
+                params.extend([None, None])
+            elif stock_filter == 'out_of_stock':
+                conditions.append("COALESCE(ps.total_stock, 0) <= 0")
             
             # Build query
             where_clause = " AND ".join(conditions) if conditions else "1=1"
             
+            # The total comes from a COUNT(*) OVER () column on the page
+            # query itself, unless a recent count for the same filters is
+            # cached (the window forces a full scan, so it is only added
+            # when a count is needed)
+            cache_key = (query.strip().lower(), category_id, brand, in_stock_only, stock_filter, product_id)
+            cached = self._count_cache.get(cache_key)
+            need_count = with_total and (
+                cached is None or time.monotonic() - cached[0] > SEARCH_COUNT_CACHE_TTL)
+            total_column = ",\n                COUNT(*) OVER () as _total" if need_count else ""
+            
+            # Names starting with the query come first. Without a query the
+            # plain name order can be read straight from idx_product_summary_name
+            if query:
+                order_clause = "CASE WHEN ps.name LIKE ? ESCAPE '\\' THEN 1 ELSE 2 END, ps.name ASC"
+            else:
+                order_clause = "ps.name ASC"
+            
             search_query = f"""
-            SELECT DISTINCT
+            SELECT
                 p.id, p.name, p.slug, p.type, p.category, p.brand,
                 p.description, p.short_description, p.image_path,
                 p.is_active, p.price, p.cost_price, p.sku, p.barcode,
                 p.stock_quantity, p.stock_status, p.low_stock_threshold,
                 p.weight_kg, p.length_cm, p.width_cm, p.height_cm,
                 p.created_at, p.updated_at,
-                -- Get lowest variation price
-                MIN(pv.price) as min_variation_price,
-                MAX(pv.price) as max_variation_price,
-                -- Check if has variations
+                ps.min_price as min_variation_price,
+                ps.max_price as max_variation_price,
                 CASE WHEN p.type = 'variable' THEN 1 ELSE 0 END as has_variations,
-                -- Total stock across variations
-                COALESCE(SUM(pv.stock_quantity), p.stock_quantity) as total_stock
-            FROM products p
-            LEFT JOIN product_variations pv ON p.id = pv.product_id AND pv.is_active = 1
+                ps.total_stock,
+                ps.variation_count,
+                ps.display_price,
+                ps.variation_codes,
+                COALESCE(c.name, p.category) as category_name{total_column}
+            FROM product_summary ps
+            JOIN products p ON p.id = ps.product_id
+            LEFT JOIN categories c ON c.id = p.category
             WHERE {where_clause}
-            GROUP BY p.id
-            ORDER BY 
-                CASE WHEN p.name LIKE ? THEN 1 ELSE 2 END,
-                p.name ASC
+            ORDER BY {order_clause}
             LIMIT ? OFFSET ?
             """
             
-            # Add ordering parameter and pagination
+            # Ordering parameter and pagination go into a new list so params
+            # still holds only the WHERE parameters for the count fallback
             if query:
-                params.append(f"{query}%")
+                page_params = [*params, f"{_escape_like(query)}%", limit, offset]
             else:
-                params.append("")
-            
-            params.extend([limit, offset])
+                page_params = [*params, limit, offset]
             
             # Execute search
-            results = self.db.execute_query(search_query, tuple(params))
-            products = []
+            products = self.db.execute_query(search_query, page_params)
             
-            for row in results:
-                product = dict(row)
-                
-                # Format price information
-                if product['has_variations']:
-                    if product['min_variation_price'] == product['max_variation_price']:
-                        product['display_price'] = f"${product['min_variation_price']:.2f}"
+            # Get total count for pagination
+            if not with_total:
+                total_count = None
+                has_more = len(products) == limit
+            else:
+                if need_count:
+                    if products:
+                        total_count = products[0]['_total']
+                        for product in products:
+                            del product['_total']
+                    elif offset == 0:
+                        total_count = 0
                     else:
-                        product['display_price'] = f"${product['min_variation_price']:.2f} - ${product['max_variation_price']:.2f}"
+                        # Page past the end: no row carries the total
+                        join_clause = "JOIN products p ON p.id = ps.product_id" if needs_products else ""
+                        count_query = f"""
+                        SELECT COUNT(*) as total_count
+                        FROM product_summary ps
+                        {join_clause}
+                        WHERE {where_clause}
+                        """
+                        count_result = self.db.execute_query(count_query, params)
+                        total_count = count_result[0]['total_count'] if count_result else 0
+                    self._count_cache[cache_key] = (time.monotonic(), total_count)
                 else:
-                    product['display_price'] = f"${product['price']:.2f}" if product['price'] else "N/A"
-                
-                # Get variation count
-                variation_query = """
-                SELECT COUNT(*) as variation_count 
-                FROM product_variations 
-                WHERE product_id = ? AND is_active = 1
-                """
-                variation_result = self.db.execute_query(variation_query, (product['id'],))
-                product['variation_count'] = variation_result[0]['variation_count'] if variation_result else 0
-                
-                products.append(product)
-            
-            # Get total count for pagination
-            count_query = f"""
-            SELECT COUNT(DISTINCT p.id) as total_count
-            FROM products p
-            LEFT JOIN product_variations pv ON p.id = pv.product_id AND pv.is_active = 1
-            WHERE {where_clause}
-            """
-            
-            # Remove ordering and pagination from params for count query
-            # Remove the last 3 params (search_prefix, limit, offset)
-            count_params = params[:-3]
-            count_result = self.db.execute_query(count_query, tuple(count_params))
-            total_count = count_result[0]['total_count'] if count_result else 0
+                    total_count = cached[1]
+                has_more = offset + len(products) < total_count
             
             return {
                 'success': True,
                 'message': f'Found {len(products)} products',
                 'products': products,
                 'total_count': total_count,
+                'has_more': has_more,
                 'limit': limit,
                 'offset': offset
             }
@@ -794,7 +931,8 @@ class ProductController:
                 'success': False,
                 'message': f'Error searching products: {str(e)}',
                 'products': [],
-                'total_count': 0
+                'total_count': 0,
+                'has_more': False
             }
     
     def bulk_update_stock(self, updates: List[Dict[str, Any]], 
@@ -802,6 +940,12 @@ class ProductController:
         """
         Update stock for multiple variations in a single transaction.
         
+        Updates with a missing field or an unknown variation are skipped and
+        reported in failed_updates. The rest are written together, so the
+        batch is all-or-nothing at the database level: if any write fails,
+        the whole transaction is rolled back and every update is returned
+        in failed_updates with success False.
+        
         Args:
             updates: List of dictionaries with variation_id and qty_change
             user_id: User ID making the changes
@@ -814,9 +958,34 @@ class ProductController:
             results = []
             failed_updates = []
             
+            movement_rows = []
+            new_stocks = {}  # variation_id -> stock after all updates so far
+            
+            # One timestamp for every movement in the batch
+            current_time = datetime.now()
+            
             with self.db.get_connection() as conn:
+                # Take the write lock before reading stock so a concurrent
+                # writer cannot change it between the read and the update
+                conn.execute("BEGIN IMMEDIATE")
                 cursor = conn.cursor()
                 
+                # Fetch the current stock of every referenced variation up
+                # front instead of one SELECT per update
+                variation_ids = list({u['variation_id'] for u in updates if u.get('variation_id')})
+                current_stocks = {}  # variation_id -> (product_id, stock_quantity)
+                
+                for start in range(0, len(variation_ids), SQL_IN_BATCH_SIZE):
+                    chunk = variation_ids[start:start + SQL_IN_BATCH_SIZE]
+                    placeholders = ','.join(['?'] * len(chunk))
+                    cursor.execute(f"""
+                    SELECT id, product_id, stock_quantity
+                    FROM product_variations
+                    WHERE id IN ({placeholders})
+                    """, chunk)
+                    for row in cursor.fetchall():
+                        current_stocks[row[0]] = (row[1], row[2])
+                
                 for update in updates:
                     variation_id = update.get('variation_id')
                     qty_change = update.get('qty_change')
@@ -830,10 +999,7 @@ class ProductController:
                         continue
                     
                     try:
-                        # Get current stock
-                        stock_query = "SELECT stock_quantity FROM product_variations WHERE id = ?"
-                        cursor.execute(stock_query, (variation_id,))
-                        result = cursor.fetchone()
+                        result = current_stocks.get(variation_id)
                         
                         if not result:
                             failed_updates.append({
@@ -842,30 +1008,23 @@ class ProductController:
                             })
                             continue
                         
-                        current_stock = result[0] or 0
-                        new_stock = current_stock + qty_change
+                        product_id = result[0]
+                        if variation_id in new_stocks:
+                            # Same variation updated earlier in this batch
+                            current_stock = new_stocks[variation_id]
+                        else:
+                            current_stock = result[1] or 0
                         
-                        # Insert stock movement
-                        movement_query = """
-                        INSERT INTO stock_movements (
-                            product_variation_id, movement_type, quantity,
-                            balance_before, balance_after, reason_description,
-                            user_id, notes, movement_date
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """
+                        new_stock = current_stock + qty_change
+                        new_stocks[variation_id] = new_stock
                         
                         movement_type = 'adjustment'  # Valid type
-                        
-                        cursor.execute(movement_query, (
-                            variation_id, movement_type, abs(qty_change),
+                        movement_rows.append((
+                            product_id, variation_id, movement_type, abs(qty_change),
                             current_stock, new_stock, reason,
-                            user_id, notes, datetime.now()
+                            user_id, notes, current_time, DEFAULT_WAREHOUSE_ID
                         ))
                         
-                        # Update stock
-                        update_query = "UPDATE product_variations SET stock_quantity = ? WHERE id = ?"
-                        cursor.execute(update_query, (new_stock, variation_id))
-                        
                         results.append({
                             'variation_id': variation_id,
                             'old_quantity': current_stock,
@@ -880,18 +1039,49 @@ class ProductController:
                             'error': str(e)
                         })
                 
+                # Insert all stock movements at once
+                movement_query = """
+                INSERT INTO stock_movements (
+                    product_id, product_variation_id, movement_type, quantity,
+                    balance_before, balance_after, reason_description,
+                    user_id, notes, movement_date, warehouse_id
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """
+                cursor.executemany(movement_query, movement_rows)
+                
+                # Write the final stock of every variation with one
+                # UPDATE ... CASE per chunk (3 parameters per variation)
+                stock_items = list(new_stocks.items())
+                chunk_size = SQL_IN_BATCH_SIZE // 3
+                
+                for start in range(0, len(stock_items), chunk_size):
+                    chunk = stock_items[start:start + chunk_size]
+                    case_parts = ' '.join(['WHEN ? THEN ?'] * len(chunk))
+                    placeholders = ','.join(['?'] * len(chunk))
+                    update_query = f"""
+                    UPDATE product_variations
+                    SET stock_quantity = CASE id {case_parts} END
+                    WHERE id IN ({placeholders})
+                    """
+                    params = [value for pair in chunk for value in pair]
+                    params.extend(variation_id for variation_id, _ in chunk)
+                    cursor.execute(update_query, params)
+                
+                self._invalidate_search_counts()
+                
+                # Log audit event in the same transaction
+                self._log_audit_event(
+                    user_id=user_id,
+                    action='update',
+                    entity_type='stock_movements',
+                    entity_id=None,
+                    details=f'Bulk stock update: {len(results)} successful, {len(failed_updates)} failed',
+                    status='success' if not failed_updates else 'partial',
+                    cursor=cursor
+                )
+                
                 conn.commit()
             
-            # Log audit event
-            self._log_audit_event(
-                user_id=user_id,
-                action='update',
-                entity_type='stock_movements',
-                entity_id=None,
-                details=f'Bulk stock update: {len(results)} successful, {len(failed_updates)} failed',
-                status='success' if not failed_updates else 'partial'
-            )
-            
             return {
                 'success': True,
                 'message': f'Bulk update completed: {len(results)} successful, {len(failed_updates)} failed',
@@ -929,58 +1119,45 @@ class ProductController:
             Dictionary with low stock products
         """
         try:
-            query = """
-            SELECT 
+            # Parent products that are low themselves or have a low variation
+            query = f"""
+            SELECT
                 p.id, p.name, p.sku, p.barcode, p.image_path,
                 p.stock_quantity as product_stock,
-                p.low_stock_threshold,
-                -- Get variations with low stock
-                (
-                    SELECT GROUP_CONCAT(
-                        pv.id || ':' || pv.sku || ':' || pv.stock_quantity
-                    )
-                    FROM product_variations pv
-                    WHERE pv.product_id = p.id 
-                    AND pv.is_active = 1
-                    AND pv.stock_quantity <= COALESCE(?, pv.low_stock_threshold)
-                ) as low_variations
+                p.low_stock_threshold
             FROM products p
             WHERE p.is_active = 1
-            AND (
-                -- Product itself has low stock (for simple products)
-                (p.type = 'simple' AND p.stock_quantity <= COALESCE(?, p.low_stock_threshold))
-                OR
-                -- Has variations with low stock
-                EXISTS (
-                    SELECT 1 FROM product_variations pv
-                    WHERE pv.product_id = p.id 
-                    AND pv.is_active = 1
-                    AND pv.stock_quantity <= COALESCE(?, pv.low_stock_threshold)
-                )
-            )
-            ORDER BY p.stock_quantity ASC, p.name ASC
+            AND {LOW_STOCK_CONDITION}
+            ORDER BY product_stock ASC, p.name ASC
             """
             
-            results = self.db.execute_query(query, (threshold, threshold, threshold))
-            low_stock_products = []
-            
-            for row in results:
-                product = dict(row)
-                
-                # Parse variations string
-                variations_info = []
-                if product['low_variations']:
-                    for var_str in product['low_variations'].split(','):
-                        var_parts = var_str.split(':')
-                        if len(var_parts) >= 3:
-                            variations_info.append({
-                                'variation_id': int(var_parts[0]),
-                                'sku': var_parts[1],
-                                'stock_quantity': int(var_parts[2])
-                            })
+            low_stock_products = self.db.execute_query(query, (threshold, threshold))
+            
+            # Fetch the low variations of all those products in batched IN queries
+            groups = defaultdict(list)
+            product_ids = [product['id'] for product in low_stock_products]
+            
+            for start in range(0, len(product_ids), SQL_IN_BATCH_SIZE):
+                batch = product_ids[start:start + SQL_IN_BATCH_SIZE]
+                placeholders = ','.join(['?'] * len(batch))
+                variations_query = f"""
+                SELECT product_id, id, sku, stock_quantity
+                FROM product_variations
+                WHERE product_id IN ({placeholders})
+                AND is_active = 1
+                AND stock_quantity <= COALESCE(?, low_stock_threshold, 5)
+                ORDER BY id
+                """
                 
-                product['low_variations_list'] = variations_info
-                low_stock_products.append(product)
+                for row in self.db.execute_query(variations_query, (*batch, threshold)):
+                    groups[row['product_id']].append({
+                        'variation_id': row['id'],
+                        'sku': row['sku'],
+                        'stock_quantity': row['stock_quantity']
+                    })
+            
+            for product in low_stock_products:
+                product['low_variations_list'] = groups.get(product['id'], [])
             
             return {
                 'success': True,
@@ -996,26 +1173,26 @@ class ProductController:
                 'products': []
             }
     
+    def _invalidate_search_counts(self) -> None:
+        """Drop cached search counts after products or stock change."""
+        self._count_cache.clear()
+    
     def _generate_slug(self, name: str) -> str:
         """Generate URL slug from product name."""
-        import re
-        slug = name.lower()
-        slug = re.sub(r'[^a-z0-9]+', '-', slug)
-        slug = re.sub(r'^-+|-+$', '', slug)
-        return slug
+        return _SLUG_TRIM.sub('', _SLUG_NON_ALNUM.sub('-', name.lower()))
     
     def _generate_sku(self, name: str) -> str:
         """Generate SKU from product name."""
-        import uuid
         # Get first 3 letters of each word
         words = name.split()
         prefix = ''.join([word[:3].upper() for word in words[:2]])[:6]
-        # Add unique suffix
-        suffix = str(uuid.uuid4().int)[:6]
+        # Add unique suffix (uniform over 000000-999999)
+        suffix = f"{secrets.randbelow(10**6):06d}"
         return f"{prefix}-{suffix}"
     
     def _log_audit_event(self, user_id: int, action: str, entity_type: str, 
-                        entity_id: Optional[int], details: str, status: str = 'success') -> None:
+                        entity_id: Optional[int], details: str, status: str = 'success',
+                        cursor=None) -> None:
         """
         Log event to audit_logs table.
         
@@ -1026,20 +1203,23 @@ class ProductController:
             entity_id: Entity ID
             details: Detailed description (will be stored in change_summary)
             status: Success/failure status
+            cursor: Cursor inside the caller's transaction, so the event
+                commits together with the change it records (None = write
+                it on its own)
         """
         try:
-            query = """
-            INSERT INTO audit_logs 
-            (user_id, action_type, module, entity_type, entity_id, change_summary, status, action_timestamp)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """
-            
             # Use entity_type for both module and entity_type for now
-            self.db.execute_update(query, (
+            params = (
                 user_id, action, entity_type, entity_type, entity_id, details, status, datetime.now()
-            ))
+            )
+            
+            if cursor is not None:
+                cursor.execute(AUDIT_LOG_QUERY, params)
+            else:
+                self.db.execute_update(AUDIT_LOG_QUERY, params)
         except Exception as e:
-            print(f"Error logging audit event: {e}")
+            logger.error("Error logging audit event: %s", e)
+    
     def update_product(self, product_id: int, product_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Update an existing product.
@@ -1056,66 +1236,40 @@ class ProductController:
             with self.db.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                # Check if product exists
-                check_query = "SELECT id FROM products WHERE id = ?"
-                cursor.execute(check_query, (product_id,))
-                if not cursor.fetchone():
+                # Only whitelisted fields are written; the SQL text is cached
+                # per combination of fields
+                fields = tuple(field for field in self.UPDATE_ALLOWED_FIELDS if field in product_data)
+                update_query = _build_update_sql(fields)
+                
+                values = [product_data[field] for field in fields]
+                values.append(datetime.now())  # updated_at
+                values.append(product_id)  # WHERE id = ?
+                
+                cursor.execute(update_query, values)
+                
+                # No row touched means the product does not exist
+                if cursor.rowcount == 0:
                     return {
                         'success': False,
                         'message': 'Product not found'
                     }
                 
-                # Build update query
-                update_fields = []
-                values = []
-                
-                # Allowed fields to update
-                allowed_fields = [
-                    'name', 'category', 'subcategory', 'brand', 'description',
-                    'short_description', 'price', 'cost_price', 'wholesale_price',
-                    'suggested_retail_price', 'tax_class', 'tax_rate', 'sku',
-                    'barcode', 'weight_kg', 'length_cm', 'width_cm', 'height_cm',
-                    'manufacturer', 'country_of_origin', 'warranty_period_months',
-                    'has_warranty', 'support_email', 'support_phone',
-                    'min_order_quantity', 'max_order_quantity', 'is_active',
-                    'is_featured', 'stock_quantity', 'low_stock_threshold',
-                    'updated_by'
-                ]
-                
-                for field in allowed_fields:
-                    if field in product_data:
-                        update_fields.append(f"{field} = ?")
-                        values.append(product_data[field])
-                
-                # Add updated_at timestamp
-                update_fields.append("updated_at = ?")
-                values.append(datetime.now())
-                
-                # Add product_id for WHERE clause
-                values.append(product_id)
+                self._invalidate_search_counts()
                 
-                # Execute update
-                update_query = f"""
-                UPDATE products 
-                SET {', '.join(update_fields)}
-                WHERE id = ?
-                """
-                
-                cursor.execute(update_query, tuple(values))
-                
-                # Commit transaction
-                conn.commit()
-                
-                # Log audit event
+                # Log audit event in the same transaction
                 self._log_audit_event(
                     user_id=product_data.get('updated_by'),
                     action='update',
                     entity_type='products',
                     entity_id=product_id,
                     details=f'Updated product {product_id}',
-                    status='success'
+                    status='success',
+                    cursor=cursor
                 )
                 
+                # Commit transaction
+                conn.commit()
+                
                 return {
                     'success': True,
                     'message': 'Product updated successfully',
@@ -1154,9 +1308,17 @@ class ProductController:
             with self.db.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                # Check if product exists
-                check_query = "SELECT id, name FROM products WHERE id = ?"
-                cursor.execute(check_query, (product_id,))
+                # Soft delete product; the existence check and name lookup
+                # are folded into the same statement
+                delete_query = """
+                UPDATE products 
+                SET is_active = 0, updated_at = ?, updated_by = ?
+                WHERE id = ? AND is_active = 1
+                RETURNING name
+                """
+                
+                current_time = datetime.now()
+                cursor.execute(delete_query, (current_time, user_id, product_id))
                 result = cursor.fetchone()
                 
                 if not result:
@@ -1167,15 +1329,6 @@ class ProductController:
                 
                 product_name = result['name']
                 
-                # Soft delete product
-                delete_query = """
-                UPDATE products 
-                SET is_active = 0, updated_at = ?, updated_by = ?
-                WHERE id = ?
-                """
-                
-                cursor.execute(delete_query, (datetime.now(), user_id, product_id))
-                
                 # Also soft delete variations
                 variations_query = """
                 UPDATE product_variations 
@@ -1183,21 +1336,24 @@ class ProductController:
                 WHERE product_id = ?
                 """
                 
-                cursor.execute(variations_query, (datetime.now(), product_id))
+                cursor.execute(variations_query, (current_time, product_id))
                 
-                # Commit transaction
-                conn.commit()
+                self._invalidate_search_counts()
                 
-                # Log audit event
+                # Log audit event in the same transaction
                 self._log_audit_event(
                     user_id=user_id,
                     action='delete',
                     entity_type='products',
                     entity_id=product_id,
                     details=f'Soft deleted product {product_id}: {product_name}',
-                    status='success'
+                    status='success',
+                    cursor=cursor
                 )
                 
+                # Commit transaction
+                conn.commit()
+                
                 return {
                     'success': True,
                     'message': 'Product deleted successfully',
@@ -1220,13 +1376,16 @@ class ProductController:
                 'message': f'Error deleting product: {str(e)}'
             }
     
-    def export_products_csv(self, file_path: str, product_ids: List[int] = None) -> Dict[str, Any]:
+    def export_products_csv(self, file_path: str, product_ids: List[int] = None,
+                            progress_callback: Callable[[int], None] = None) -> Dict[str, Any]:
         """
         Export products to CSV file.
         
         Args:
             file_path: Path to save CSV file
             product_ids: List of product IDs to export (None = all active products)
+            progress_callback: Called with the number of rows written so far
+                after each batch (optional)
             
         Returns:
             Dictionary with success status and export stats
@@ -1269,10 +1428,11 @@ class ProductController:
                 """
                 params = []
             
-            # Fetch data
-            products = self.db.execute_query(query, tuple(params))
+            # Stream rows from the cursor in batches instead of loading them all
+            batches = self.db.iter_query_batches(query, params)
+            first_batch = next(batches, None)
             
-            if not products:
+            if first_batch is None:
                 return {
                     'success': False,
                     'message': 'No products found to export',
@@ -1280,7 +1440,7 @@ class ProductController:
                     'file_path': None
                 }
             
-            # Define CSV columns
+            # Define CSV columns (same order as the SELECT list)
             fieldnames = [
                 'ID', 'Name', 'SKU', 'Barcode', 'Type', 'Category',
                 'Brand', 'Price', 'Cost Price', 'Stock Quantity',
@@ -1290,35 +1450,41 @@ class ProductController:
                 'Variation Count'
             ]
             
+            def format_row(row):
+                """Build a CSV row from a result row by column position."""
+                (product_id, name, sku, barcode, product_type, category, brand,
+                 price, cost_price, stock_quantity, stock_status, low_stock_threshold,
+                 weight_kg, length_cm, width_cm, height_cm, manufacturer,
+                 country_of_origin, created_at, updated_at, variation_count) = row
+                return (
+                    product_id, name, sku or '', barcode or '', product_type,
+                    category or '', brand or '',
+                    format(price, '.2f') if price is not None else '',
+                    format(cost_price, '.2f') if cost_price else '',
+                    stock_quantity, stock_status, low_stock_threshold,
+                    format(weight_kg, '.3f') if weight_kg else '',
+                    format(length_cm, '.2f') if length_cm else '',
+                    format(width_cm, '.2f') if width_cm else '',
+                    format(height_cm, '.2f') if height_cm else '',
+                    manufacturer or '', country_of_origin or '',
+                    created_at, updated_at, variation_count
+                )
+            
             # Write to CSV
-            with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                
-                for product in products:
-                    writer.writerow({
-                        'ID': product['id'],
-                        'Name': product['name'],
-                        'SKU': product['sku'] or '',
-                        'Barcode': product['barcode'] or '',
-                        'Type': product['type'],
-                        'Category': product['category'] or '',
-                        'Brand': product['brand'] or '',
-                        'Price': f"{product['price']:.2f}",
-                        'Cost Price': f"{product['cost_price']:.2f}" if product['cost_price'] else '',
-                        'Stock Quantity': product['stock_quantity'],
-                        'Stock Status': product['stock_status'],
-                        'Low Stock Threshold': product['low_stock_threshold'],
-                        'Weight (kg)': f"{product['weight_kg']:.3f}" if product['weight_kg'] else '',
-                        'Length (cm)': f"{product['length_cm']:.2f}" if product['length_cm'] else '',
-                        'Width (cm)': f"{product['width_cm']:.2f}" if product['width_cm'] else '',
-                        'Height (cm)': f"{product['height_cm']:.2f}" if product['height_cm'] else '',
-                        'Manufacturer': product['manufacturer'] or '',
-                        'Country of Origin': product['country_of_origin'] or '',
-                        'Created At': product['created_at'],
-                        'Updated At': product['updated_at'],
-                        'Variation Count': product['variation_count']
-                    })
+            exported_count = 0
+            with open(file_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(fieldnames)
+                writer.writerows(map(format_row, first_batch))
+                exported_count = len(first_batch)
+                if progress_callback:
+                    progress_callback(exported_count)
+                
+                for batch in batches:
+                    writer.writerows(map(format_row, batch))
+                    exported_count += len(batch)
+                    if progress_callback:
+                        progress_callback(exported_count)
             
             # Log audit event
             self._log_audit_event(
@@ -1326,14 +1492,14 @@ class ProductController:
                 action='export',
                 entity_type='products',
                 entity_id=None,
-                details=f'Exported {len(products)} products to {file_path}',
+                details=f'Exported {exported_count} products to {file_path}',
                 status='success'
             )
             
             return {
                 'success': True,
-                'message': f'Successfully exported {len(products)} products',
-                'exported_count': len(products),
+                'message': f'Successfully exported {exported_count} products',
+                'exported_count': exported_count,
                 'file_path': file_path
             }
             
@@ -1356,8 +1522,12 @@ class ProductController:
             Dictionary with variations list
         """
         try:
+            # Parent info comes from the same query; the LEFT JOIN still
+            # returns one row (with NULL variation columns) when the product
+            # has no active variations
             query = """
             SELECT 
+                p.name as product_name, p.sku as product_sku,
                 pv.id, pv.name, pv.sku, pv.barcode, pv.price,
                 pv.cost_price, pv.wholesale_price, pv.sale_price,
                 pv.stock_quantity, pv.stock_status, pv.low_stock_threshold,
@@ -1365,39 +1535,34 @@ class ProductController:
                 pv.attribute_combination, pv.image_path,
                 pv.is_active, pv.is_default_variation,
                 pv.created_at, pv.updated_at
-            FROM product_variations pv
-            WHERE pv.product_id = ? AND pv.is_active = 1
+            FROM products p
+            LEFT JOIN product_variations pv
+                ON pv.product_id = p.id AND pv.is_active = 1
+            WHERE p.id = ?
             ORDER BY 
                 pv.is_default_variation DESC,
                 pv.created_at ASC
             """
             
-            results = self.db.execute_query(query, (product_id,))
+            rows = self.db.execute_query(query, (product_id,))
+            product_info = {'name': 'Unknown', 'sku': ''}
             variations = []
             
-            for row in results:
-                variation = dict(row)
+            for row in rows:
+                product_info = {'name': row.pop('product_name'), 'sku': row.pop('product_sku')}
+                if row['id'] is None:
+                    continue
                 
                 # Parse JSON fields
-                if variation.get('attribute_combination'):
-                    try:
-                        variation['attribute_combination'] = json.loads(variation['attribute_combination'])
-                    except:
-                        variation['attribute_combination'] = {}
-                
-                variations.append(variation)
-            
-            # Get parent product info for context
-            product_query = "SELECT name, sku FROM products WHERE id = ?"
-            product_result = self.db.execute_query(product_query, (product_id,))
-            product_info = dict(product_result[0]) if product_result else {}
+                self._parse_attribute_combination(row)
+                variations.append(row)
             
             return {
                 'success': True,
                 'message': f'Found {len(variations)} variations',
                 'product_id': product_id,
-                'product_name': product_info.get('name', 'Unknown'),
-                'product_sku': product_info.get('sku', ''),
+                'product_name': product_info['name'],
+                'product_sku': product_info['sku'],
                 'variations': variations,
                 'variation_count': len(variations)
             }
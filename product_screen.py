@@ -5,38 +5,273 @@ File: product_screen.py
 This module implements the product management screen with search, view, and edit capabilities.
 """
 
-import sys
+import html
+import logging
+import re
+import time
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
+
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
-    QPushButton, QLabel, QLineEdit, QTableWidget,
-    QTableWidgetItem, QHeaderView, QFrame, QComboBox,
+    QWidget, QDialog, QVBoxLayout, QHBoxLayout, QGridLayout, QFormLayout,
+    QPushButton, QLabel, QLineEdit, QHeaderView, QFrame, QComboBox,
     QMessageBox, QTextEdit, QSpinBox, QDoubleSpinBox,
-    QCheckBox, QGroupBox, QTabWidget, QSplitter, QScrollArea,
-    QProgressBar, QToolButton, QMenu, QSizePolicy
+    QCheckBox, QGroupBox, QTabWidget, QSplitter, QProgressBar,
+    QProgressDialog, QFileDialog, QTableView, QAbstractItemView, QStyle
+)
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QTimer, QAbstractTableModel, QModelIndex, QSize,
+    QObject, QRunnable, QThreadPool, QThread
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
-from PyQt6.QtGui import QFont, QIcon, QColor, QAction
+from PyQt6.QtGui import QFont, QIcon, QColor, QBrush, QStandardItemModel, QStandardItem
 
-from product_controller import ProductController
+from product_controller import ProductController, LOW_STOCK_CONDITION, FTS_MIN_TERM_LENGTH
 from translations import TranslationManager
-from config_manager import ConfigManager
-# Add these imports at the top
-import os
-import csv
-from datetime import datetime
-from PyQt6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QFormLayout,
-    QLineEdit, QComboBox, QSpinBox, QDoubleSpinBox,
-    QTextEdit, QCheckBox, QPushButton, QLabel,
-    QTableWidget, QTableWidgetItem, QHeaderView,
-    QFileDialog, QMessageBox, QTabWidget, QGroupBox
+
+logger = logging.getLogger(__name__)
+
+# Searches this short are answered from ProductScreen's prefix cache
+SHORT_QUERY_LENGTH = 3
+SEARCH_CACHE_SIZE = 64
+# Seconds the supplier dropdown list is reused between dialog opens
+SUPPLIER_CACHE_TTL = 60
+# Seconds ProductScreen reuses its stats counters unless products changed
+STATS_CACHE_TTL = 30
+# Rendered details panels kept by ProductScreen, keyed by the values shown
+DETAILS_HTML_CACHE_SIZE = 128
+# Product row fields the details panel shows; with the variation count they
+# form the cache key, since stock changes through variations and category
+# renames do not touch the product's updated_at
+DETAILS_KEY_FIELDS = (
+    'id', 'name', 'sku', 'type', 'category', 'category_name', 'brand', 'price',
+    'cost_price', 'stock_quantity', 'stock_status', 'created_at', 'updated_at',
+    'description'
+)
+# Choices offered by the product form combos (type matches the products
+# table CHECK constraint)
+PRODUCT_TYPES = ('simple', 'variable', 'grouped', 'digital')
+TAX_CLASSES = ('standard', 'reduced', 'zero', 'exempt')
+# ProductScreen stats: all four counters in one pass over products, with
+# each product's active variations summarized once in the CTE. Low stock
+# is LOW_STOCK_CONDITION, the same test as get_low_stock_products and the
+# low_stock filter. One constant string means every refresh reuses the
+# same prepared statement from sqlite3's cache.
+PRODUCT_STATS_QUERY = f"""
+WITH variation_stock AS (
+    SELECT product_id,
+           MAX(stock_quantity > 0) AS has_stock
+    FROM product_variations
+    WHERE is_active = 1
+    GROUP BY product_id
 )
-from PyQt6.QtCore import Qt
+SELECT
+    COUNT(*) AS total_count,
+    SUM(p.stock_quantity > 0 OR COALESCE(vs.has_stock, 0)) AS in_stock_count,
+    SUM({LOW_STOCK_CONDITION}) AS low_stock_count,
+    SUM(p.stock_quantity = 0 AND NOT COALESCE(vs.has_stock, 0)) AS out_stock_count
+FROM products p
+LEFT JOIN variation_stock vs ON vs.product_id = p.id
+WHERE p.is_active = 1
+"""
+# Details panel markup, filled with format_map from the product row
+PRODUCT_DETAILS_HTML = """
+            <div style="font-family: 'Segoe UI', Arial, sans-serif;">
+                <h2 style="color: #e74c3c; margin-bottom: 10px;">{name}</h2>
+                <p><strong>ID:</strong> {id}</p>
+                <p><strong>SKU:</strong> {sku}</p>
+                <p><strong>Type:</strong> {type}</p>
+                <p><strong>Category:</strong> {category_display}</p>
+                <p><strong>Brand:</strong> {brand}</p>
+                <p><strong>Price:</strong> ${price:.2f}</p>
+                <p><strong>Cost:</strong> {cost_display}</p>
+                <p><strong>Stock:</strong> {stock_quantity} ({stock_status})</p>
+                <p><strong>Variations:</strong> {variation_count}</p>
+                <p><strong>Created:</strong> {created_at}</p>
+                <p><strong>Updated:</strong> {updated_at}</p>
+            </div>
+            """
+# Values PRODUCT_DETAILS_HTML shows for columns missing from the row
+PRODUCT_DETAILS_DEFAULTS = {
+    'name': 'N/A', 'id': 'N/A', 'sku': 'N/A', 'type': 'N/A', 'brand': 'N/A',
+    'price': 0.00, 'stock_quantity': 0, 'stock_status': 'N/A',
+    'created_at': 'N/A', 'updated_at': 'N/A'
+}
+# Current version of one product row; every products write sets updated_at
+PRODUCT_UPDATED_AT_QUERY = "SELECT updated_at FROM products WHERE id = ?"
+# Sale dates are entered as YYYY-MM-DD text
+_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+# Seconds before the same throttled warning is logged again
+LOG_THROTTLE_SECONDS = 10
+
+# Last time each throttled warning key was logged
+_last_logged = {}
+
+
+def _warn_throttled(key, message, *args):
+    """Log a warning unless the same key was logged in the last LOG_THROTTLE_SECONDS."""
+    now = time.monotonic()
+    last = _last_logged.get(key)
+    if last is not None and now - last < LOG_THROTTLE_SECONDS:
+        return
+    _last_logged[key] = now
+    logger.warning(message, *args)
+
+
+def _safe_float(value, default=0.0):
+    """Convert a stored value to float, falling back to default."""
+    # SQLite hands back float/int/None for numeric columns; only other
+    # types need the guarded conversion
+    value_type = type(value)
+    if value_type is float:
+        return value
+    if value is None:
+        return default
+    if value_type is int:
+        return float(value)
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return default
+
+
+def _safe_int(value, default=0):
+    """Convert a stored value to int, falling back to default."""
+    value_type = type(value)
+    if value_type is int:
+        return value
+    if value is None:
+        return default
+    if value_type is float:
+        return int(value)
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return default
+
+
+def _positive_or_none(value):
+    """Return value if it is a positive number, otherwise None."""
+    try:
+        return value if value > 0 else None
+    except TypeError:
+        return None
+
+
+def _select_combo_index(combo, index):
+    """Select index in combo if the item was found."""
+    if index >= 0:
+        combo.setCurrentIndex(index)
 
 
 class ProductFormDialog(QDialog):
     """Dialog for adding/editing products (Complete Edition)."""
     
+    # (id, name) tuples of active suppliers, shared by all dialogs
+    _supplier_cache = None
+    _supplier_cache_ts = 0.0
+    
+    # Translation keys looked up once per dialog into self._t
+    TRANSLATION_KEYS = (
+        'product_name', 'sku', 'barcode', 'type', 'category', 'brand',
+        'price', 'cost_price', 'stock_quantity', 'low_stock_threshold',
+        'weight', 'description', 'short_description', 'active', 'save',
+        'cancel', 'edit_product', 'add_new_product'
+    )
+    
+    # Form bindings: (data key, widget attribute, kind, default).
+    # load_existing_data and get_form_data both walk this table.
+    FIELDS = (
+        # Basic Information
+        ('name', 'name_input', 'str', None),
+        ('sku', 'sku_input', 'str', None),
+        ('barcode', 'barcode_input', 'str', None),
+        ('type', 'type_combo', 'choice', 'simple'),
+        ('category', 'category_input', 'str', None),
+        ('subcategory', 'subcategory_input', 'str', None),
+        ('brand', 'brand_input', 'str', None),
+        ('manufacturer', 'manufacturer_input', 'str', None),
+        ('country_of_origin', 'country_input', 'str', None),
+        ('upc', 'upc_input', 'str', None),
+        ('isbn', 'isbn_input', 'str', None),
+        ('mpn', 'mpn_input', 'str', None),
+        ('product_code', 'product_code_input', 'str', None),
+        
+        # Pricing
+        ('price', 'price_input', 'float', 0.0),
+        ('cost_price', 'cost_input', 'opt_float', 0.0),
+        ('wholesale_price', 'wholesale_input', 'opt_float', 0.0),
+        ('suggested_retail_price', 'suggested_price_input', 'opt_float', 0.0),
+        ('sale_price', 'sale_price_input', 'opt_float', 0.0),
+        ('sale_start_date', 'sale_start_input', 'str', None),
+        ('sale_end_date', 'sale_end_input', 'str', None),
+        ('tax_class', 'tax_combo', 'choice', 'standard'),
+        ('tax_rate', 'tax_rate_input', 'float', 15.0),
+        ('is_taxable', 'taxable_check', 'bool', True),
+        
+        # Inventory
+        ('stock_quantity', 'stock_input', 'int', 0),
+        ('low_stock_threshold', 'low_stock_input', 'int', 5),
+        ('manage_stock', 'manage_stock_check', 'bool', True),
+        ('allow_backorders', 'allow_backorders_check', 'bool', False),
+        ('weight_kg', 'weight_input', 'opt_float', 0.0),
+        ('length_cm', 'length_input', 'opt_float', 0.0),
+        ('width_cm', 'width_input', 'opt_float', 0.0),
+        ('height_cm', 'height_input', 'opt_float', 0.0),
+        ('volume_liters', 'volume_input', 'opt_float', 0.0),
+        ('shelf_life_days', 'shelf_life_input', 'int', 0),
+        ('expiry_alert_days', 'expiry_alert_input', 'int', 30),
+        ('batch_tracking_required', 'batch_tracking_check', 'bool', False),
+        ('serial_tracking_required', 'serial_tracking_check', 'bool', False),
+        
+        # Description & SEO
+        ('description', 'desc_input', 'text', None),
+        ('short_description', 'short_desc_input', 'text', None),
+        ('meta_title', 'meta_title_input', 'str', None),
+        ('meta_description', 'meta_desc_input', 'text', None),
+        ('meta_keywords', 'meta_keywords_input', 'str', None),
+        
+        # Additional
+        ('warranty_period_months', 'warranty_period_input', 'int', 0),
+        ('warranty_type', 'warranty_type_input', 'str', None),
+        ('has_warranty', 'has_warranty_check', 'bool', False),
+        ('support_email', 'support_email_input', 'str', None),
+        ('support_phone', 'support_phone_input', 'str', None),
+        ('supplier_id', 'supplier_combo', 'ref', 0),
+        ('supplier_sku', 'supplier_sku_input', 'str', None),
+        ('lead_time_days', 'lead_time_input', 'int', 0),
+        ('requires_shipping', 'requires_shipping_check', 'bool', True),
+        ('shipping_class', 'shipping_class_input', 'str', None),
+        ('shipping_weight', 'shipping_weight_input', 'opt_float', 0.0),
+        
+        # Status
+        ('is_active', 'active_checkbox', 'bool', True),
+        ('is_featured', 'featured_checkbox', 'bool', False),
+    )
+    
+    # Per-kind widget writers (widget, value) and readers (widget)
+    _LOADERS = {
+        'str': lambda w, v: w.setText(str(v) if v is not None else ""),
+        'text': lambda w, v: w.setPlainText(str(v) if v is not None else ""),
+        'int': lambda w, v: w.setValue(_safe_int(v)),
+        'float': lambda w, v: w.setValue(_safe_float(v)),
+        'opt_float': lambda w, v: w.setValue(_safe_float(v)),
+        'bool': lambda w, v: w.setChecked(bool(v)),
+        'choice': lambda w, v: _select_combo_index(w, w.findText(str(v))),
+        'ref': lambda w, v: _select_combo_index(w, w.findData(v)),
+    }
+    _DUMPERS = {
+        'str': lambda w: w.text().strip() or None,
+        'text': lambda w: w.toPlainText().strip() or None,
+        'int': lambda w: w.value(),
+        # QDoubleSpinBox.value() is already a float
+        'float': lambda w: w.value(),
+        'opt_float': lambda w: v if (v := w.value()) > 0 else None,
+        'bool': lambda w: w.isChecked(),
+        'choice': lambda w: w.currentText(),
+        'ref': lambda w: _positive_or_none(w.currentData()),
+    }
+    
     def __init__(self, db_manager, translation_manager, product_data=None, parent=None):
         """
         Initialize product form dialog with ALL fields.
@@ -53,6 +288,8 @@ class ProductFormDialog(QDialog):
         self.translator = translation_manager
         self.product_data = product_data
         self.is_edit = product_data is not None
+        self._field_widgets = None
+        self._last_form_data = None
         
         self.setup_ui()
         self.setup_window()
@@ -63,56 +300,206 @@ class ProductFormDialog(QDialog):
     def setup_window(self):
         """Setup window properties."""
         if self.is_edit:
-            self.setWindowTitle(self.translator.get('edit_product'))
+            self.setWindowTitle(self._t['edit_product'])
         else:
-            self.setWindowTitle(self.translator.get('add_new_product'))
+            self.setWindowTitle(self._t['add_new_product'])
         
+        # An explicit size means show() does not have to walk every group
+        # box for a size hint first
         self.setMinimumSize(900, 700)
+        self.resize(900, 700)
         self.setModal(True)
     
     def setup_ui(self):
-        """Setup the user interface with tabs for all fields."""
+        """
+        Setup the user interface with tabs for all fields.
+        
+        Only the Basic tab is built here; the other tabs are built the
+        first time they are shown (see _ensure_tab).
+        """
+        # No repaints while the widgets are being created and laid out
+        self.setUpdatesEnabled(False)
+        
+        t = self.translator.get
+        self._t = {key: t(key) for key in self.TRANSLATION_KEYS}
+        
         layout = QVBoxLayout()
         
         # Tab widget for organization
-        tabs = QTabWidget()
+        self.tabs = QTabWidget()
         
-        # Tab 1: Basic Information
         basic_tab = QWidget()
-        basic_layout = QFormLayout()
+        basic_tab.setLayout(self._build_basic_tab())
+        self.tabs.addTab(basic_tab, "Basic")
+        
+        # Empty placeholders, filled in by _ensure_tab on first view
+        self._tab_builders = [
+            None,
+            self._build_pricing_tab,
+            self._build_inventory_tab,
+            self._build_desc_tab,
+            self._build_additional_tab,
+        ]
+        for label in ("Pricing", "Inventory", "Description & SEO", "Additional"):
+            self.tabs.addTab(QWidget(), label)
+        self.tabs.currentChanged.connect(self._ensure_tab)
+        
+        layout.addWidget(self.tabs)
+        
+        # Status & Actions
+        status_layout = QHBoxLayout()
+        
+        self.active_checkbox = QCheckBox(self._t['active'])
+        self.active_checkbox.setChecked(True)
+        
+        self.featured_checkbox = QCheckBox("Featured Product")
+        
+        status_layout.addWidget(self.active_checkbox)
+        status_layout.addWidget(self.featured_checkbox)
+        status_layout.addStretch()
+        
+        layout.addLayout(status_layout)
+        
+        # Buttons
+        button_layout = QHBoxLayout()
+        
+        self.save_btn = QPushButton(self._t['save'])
+        self.save_btn.setObjectName("primary")
+        self.save_btn.clicked.connect(self.on_save)
+        
+        self.cancel_btn = QPushButton(self._t['cancel'])
+        self.cancel_btn.clicked.connect(self.reject)
+        
+        button_layout.addStretch()
+        button_layout.addWidget(self.save_btn)
+        button_layout.addWidget(self.cancel_btn)
+        
+        layout.addLayout(button_layout)
+        
+        self.setLayout(layout)
+        self.setUpdatesEnabled(True)
+    
+    def _ensure_tab(self, index):
+        """
+        Build the tab at the given index if it has not been built yet.
+        
+        Args:
+            index: Tab index
+        """
+        builder = self._tab_builders[index]
+        if builder is None:
+            return
+        
+        self._tab_builders[index] = None
+        page = self.tabs.widget(index)
+        page.setUpdatesEnabled(False)
+        try:
+            page.setLayout(builder())
+        finally:
+            page.setUpdatesEnabled(True)
+    
+    def _ensure_all_tabs(self):
+        """Build every tab that is still a placeholder."""
+        for index in range(len(self._tab_builders)):
+            self._ensure_tab(index)
+    
+    def _get_suppliers(self):
+        """
+        Get active suppliers for the dropdown, cached across dialogs.
+        
+        Returns:
+            List of (id, name) tuples
+        """
+        cls = type(self)
+        if (cls._supplier_cache is not None and
+                time.monotonic() - cls._supplier_cache_ts < SUPPLIER_CACHE_TTL):
+            return cls._supplier_cache
+        
+        try:
+            suppliers = self.db.execute_query_tuples("SELECT id, name FROM wholesale_partners WHERE status = 'active' ORDER BY name")
+        except Exception:
+            logger.exception("Error loading suppliers")
+            return []
+        
+        cls._supplier_cache = suppliers
+        cls._supplier_cache_ts = time.monotonic()
+        return cls._supplier_cache
+    
+    @classmethod
+    def invalidate_supplier_cache(cls):
+        """Drop the cached supplier list; call after suppliers are edited."""
+        cls._supplier_cache = None
+        cls._supplier_cache_ts = 0.0
+    
+    def _money_spin(self):
+        """Create a currency spin box."""
+        spin = QDoubleSpinBox()
+        spin.setRange(0.00, 999999.99)
+        spin.setDecimals(2)
+        spin.setPrefix("$ ")
+        return spin
+    
+    def _unit_spin(self, maximum, decimals, suffix):
+        """
+        Create a spin box for a physical measurement.
+        
+        Args:
+            maximum: Largest accepted value
+            decimals: Number of decimal places
+            suffix: Unit suffix shown after the value (e.g. " kg")
+            
+        Returns:
+            Configured QDoubleSpinBox
+        """
+        spin = QDoubleSpinBox()
+        spin.setRange(0.00, maximum)
+        spin.setDecimals(decimals)
+        spin.setSuffix(suffix)
+        return spin
+    
+    def _days_spin(self, maximum):
+        """Create a spin box for a number of days up to maximum."""
+        spin = QSpinBox()
+        spin.setRange(0, maximum)
+        spin.setSuffix(" days")
+        return spin
+    
+    def _build_basic_tab(self):
+        """Build the Basic Information tab layout."""
+        basic_layout = QVBoxLayout()
         
         # Required Fields Group
         required_group = QGroupBox("Required Information")
         required_layout = QFormLayout()
         
         self.name_input = QLineEdit()
-        required_layout.addRow(self.translator.get('product_name') + " *:", self.name_input)
+        required_layout.addRow(self._t['product_name'] + " *:", self.name_input)
         
         self.sku_input = QLineEdit()
-        required_layout.addRow(self.translator.get('sku') + ":", self.sku_input)
+        required_layout.addRow(self._t['sku'] + ":", self.sku_input)
         
         self.barcode_input = QLineEdit()
-        required_layout.addRow(self.translator.get('barcode') + ":", self.barcode_input)
+        required_layout.addRow(self._t['barcode'] + ":", self.barcode_input)
         
         self.type_combo = QComboBox()
-        self.type_combo.addItems(['simple', 'variable', 'grouped', 'digital'])
-        required_layout.addRow(self.translator.get('type') + ":", self.type_combo)
+        self.type_combo.addItems(PRODUCT_TYPES)
+        required_layout.addRow(self._t['type'] + ":", self.type_combo)
         
         self.category_input = QLineEdit()
-        required_layout.addRow(self.translator.get('category') + ":", self.category_input)
+        required_layout.addRow(self._t['category'] + ":", self.category_input)
         
         self.subcategory_input = QLineEdit()
         required_layout.addRow("Subcategory:", self.subcategory_input)
         
         required_group.setLayout(required_layout)
-        basic_layout.addRow(required_group)
+        basic_layout.addWidget(required_group)
         
         # Brand & Manufacturer Group
         brand_group = QGroupBox("Brand & Manufacturer")
         brand_layout = QFormLayout()
         
         self.brand_input = QLineEdit()
-        brand_layout.addRow(self.translator.get('brand') + ":", self.brand_input)
+        brand_layout.addRow(self._t['brand'] + ":", self.brand_input)
         
         self.manufacturer_input = QLineEdit()
         brand_layout.addRow("Manufacturer:", self.manufacturer_input)
@@ -121,7 +508,7 @@ class ProductFormDialog(QDialog):
         brand_layout.addRow("Country of Origin:", self.country_input)
         
         brand_group.setLayout(brand_layout)
-        basic_layout.addRow(brand_group)
+        basic_layout.addWidget(brand_group)
         
         # Product Identification Group
         id_group = QGroupBox("Product Identification")
@@ -140,53 +527,40 @@ class ProductFormDialog(QDialog):
         id_layout.addRow("Product Code:", self.product_code_input)
         
         id_group.setLayout(id_layout)
-        basic_layout.addRow(id_group)
+        basic_layout.addWidget(id_group)
         
-        basic_tab.setLayout(basic_layout)
+        basic_layout.addStretch()
         
-        # Tab 2: Pricing
-        pricing_tab = QWidget()
-        pricing_layout = QFormLayout()
+        return basic_layout
+    
+    def _build_pricing_tab(self):
+        """Build the Pricing tab layout."""
+        pricing_layout = QVBoxLayout()
         
         # Pricing Group
         price_group = QGroupBox("Pricing")
         price_layout = QFormLayout()
         
-        self.price_input = QDoubleSpinBox()
-        self.price_input.setRange(0.00, 999999.99)
-        self.price_input.setDecimals(2)
-        self.price_input.setPrefix("$ ")
-        price_layout.addRow(self.translator.get('price') + " *:", self.price_input)
-        
-        self.cost_input = QDoubleSpinBox()
-        self.cost_input.setRange(0.00, 999999.99)
-        self.cost_input.setDecimals(2)
-        self.cost_input.setPrefix("$ ")
-        price_layout.addRow(self.translator.get('cost_price') + ":", self.cost_input)
-        
-        self.wholesale_input = QDoubleSpinBox()
-        self.wholesale_input.setRange(0.00, 999999.99)
-        self.wholesale_input.setDecimals(2)
-        self.wholesale_input.setPrefix("$ ")
+        self.price_input = self._money_spin()
+        price_layout.addRow(self._t['price'] + " *:", self.price_input)
+        
+        self.cost_input = self._money_spin()
+        price_layout.addRow(self._t['cost_price'] + ":", self.cost_input)
+        
+        self.wholesale_input = self._money_spin()
         price_layout.addRow("Wholesale Price:", self.wholesale_input)
         
-        self.suggested_price_input = QDoubleSpinBox()
-        self.suggested_price_input.setRange(0.00, 999999.99)
-        self.suggested_price_input.setDecimals(2)
-        self.suggested_price_input.setPrefix("$ ")
+        self.suggested_price_input = self._money_spin()
         price_layout.addRow("Suggested Retail:", self.suggested_price_input)
         
         price_group.setLayout(price_layout)
-        pricing_layout.addRow(price_group)
+        pricing_layout.addWidget(price_group)
         
         # Sale Pricing Group
         sale_group = QGroupBox("Sale Pricing")
         sale_layout = QFormLayout()
         
-        self.sale_price_input = QDoubleSpinBox()
-        self.sale_price_input.setRange(0.00, 999999.99)
-        self.sale_price_input.setDecimals(2)
-        self.sale_price_input.setPrefix("$ ")
+        self.sale_price_input = self._money_spin()
         sale_layout.addRow("Sale Price:", self.sale_price_input)
         
         self.sale_start_input = QLineEdit()
@@ -198,14 +572,14 @@ class ProductFormDialog(QDialog):
         sale_layout.addRow("Sale End Date:", self.sale_end_input)
         
         sale_group.setLayout(sale_layout)
-        pricing_layout.addRow(sale_group)
+        pricing_layout.addWidget(sale_group)
         
         # Tax Group
         tax_group = QGroupBox("Tax")
         tax_layout = QFormLayout()
         
         self.tax_combo = QComboBox()
-        self.tax_combo.addItems(['standard', 'reduced', 'zero', 'exempt'])
+        self.tax_combo.addItems(TAX_CLASSES)
         tax_layout.addRow("Tax Class:", self.tax_combo)
         
         self.tax_rate_input = QDoubleSpinBox()
@@ -220,13 +594,15 @@ class ProductFormDialog(QDialog):
         tax_layout.addRow("", self.taxable_check)
         
         tax_group.setLayout(tax_layout)
-        pricing_layout.addRow(tax_group)
+        pricing_layout.addWidget(tax_group)
         
-        pricing_tab.setLayout(pricing_layout)
+        pricing_layout.addStretch()
         
-        # Tab 3: Inventory
-        inventory_tab = QWidget()
-        inventory_layout = QFormLayout()
+        return pricing_layout
+    
+    def _build_inventory_tab(self):
+        """Build the Inventory tab layout."""
+        inventory_layout = QVBoxLayout()
         
         # Stock Management Group
         stock_group = QGroupBox("Stock Management")
@@ -234,12 +610,12 @@ class ProductFormDialog(QDialog):
         
         self.stock_input = QSpinBox()
         self.stock_input.setRange(0, 999999)
-        stock_layout.addRow(self.translator.get('stock_quantity') + ":", self.stock_input)
+        stock_layout.addRow(self._t['stock_quantity'] + ":", self.stock_input)
         
         self.low_stock_input = QSpinBox()
         self.low_stock_input.setRange(0, 9999)
         self.low_stock_input.setValue(5)
-        stock_layout.addRow(self.translator.get('low_stock_threshold') + ":", self.low_stock_input)
+        stock_layout.addRow(self._t['low_stock_threshold'] + ":", self.low_stock_input)
         
         self.manage_stock_check = QCheckBox("Manage Stock")
         self.manage_stock_check.setChecked(True)
@@ -249,64 +625,45 @@ class ProductFormDialog(QDialog):
         stock_layout.addRow("", self.allow_backorders_check)
         
         stock_group.setLayout(stock_layout)
-        inventory_layout.addRow(stock_group)
+        inventory_layout.addWidget(stock_group)
         
         # Physical Properties Group
         physical_group = QGroupBox("Physical Properties")
         physical_layout = QFormLayout()
         
-        self.weight_input = QDoubleSpinBox()
-        self.weight_input.setRange(0.000, 999.999)
-        self.weight_input.setDecimals(3)
-        self.weight_input.setSuffix(" kg")
-        physical_layout.addRow(self.translator.get('weight') + ":", self.weight_input)
+        self.weight_input = self._unit_spin(999.999, 3, " kg")
+        physical_layout.addRow(self._t['weight'] + ":", self.weight_input)
         
         dimensions_layout = QHBoxLayout()
-        self.length_input = QDoubleSpinBox()
-        self.length_input.setRange(0.00, 999.99)
-        self.length_input.setDecimals(2)
-        self.length_input.setSuffix(" cm")
+        self.length_input = self._unit_spin(999.99, 2, " cm")
         dimensions_layout.addWidget(QLabel("Length:"))
         dimensions_layout.addWidget(self.length_input)
         
-        self.width_input = QDoubleSpinBox()
-        self.width_input.setRange(0.00, 999.99)
-        self.width_input.setDecimals(2)
-        self.width_input.setSuffix(" cm")
+        self.width_input = self._unit_spin(999.99, 2, " cm")
         dimensions_layout.addWidget(QLabel("Width:"))
         dimensions_layout.addWidget(self.width_input)
         
-        self.height_input = QDoubleSpinBox()
-        self.height_input.setRange(0.00, 999.99)
-        self.height_input.setDecimals(2)
-        self.height_input.setSuffix(" cm")
+        self.height_input = self._unit_spin(999.99, 2, " cm")
         dimensions_layout.addWidget(QLabel("Height:"))
         dimensions_layout.addWidget(self.height_input)
         
         physical_layout.addRow("Dimensions:", dimensions_layout)
         
-        self.volume_input = QDoubleSpinBox()
-        self.volume_input.setRange(0.000, 999.999)
-        self.volume_input.setDecimals(3)
-        self.volume_input.setSuffix(" L")
+        self.volume_input = self._unit_spin(999.999, 3, " L")
         physical_layout.addRow("Volume:", self.volume_input)
         
         physical_group.setLayout(physical_layout)
-        inventory_layout.addRow(physical_group)
+        inventory_layout.addWidget(physical_group)
         
         # Expiry & Batch Group
         expiry_group = QGroupBox("Expiry & Batch Tracking")
         expiry_layout = QFormLayout()
         
-        self.shelf_life_input = QSpinBox()
-        self.shelf_life_input.setRange(0, 3650)
-        self.shelf_life_input.setSuffix(" days")
+        self.shelf_life_input = self._days_spin(3650)
         expiry_layout.addRow("Shelf Life:", self.shelf_life_input)
         
-        self.expiry_alert_input = QSpinBox()
-        self.expiry_alert_input.setRange(0, 365)
+        self.expiry_alert_input = self._days_spin(365)
         self.expiry_alert_input.setValue(30)
-        self.expiry_alert_input.setSuffix(" days")
         expiry_layout.addRow("Expiry Alert Days:", self.expiry_alert_input)
         
         self.batch_tracking_check = QCheckBox("Batch Tracking Required")
@@ -316,23 +673,25 @@ class ProductFormDialog(QDialog):
         expiry_layout.addRow("", self.serial_tracking_check)
         
         expiry_group.setLayout(expiry_layout)
-        inventory_layout.addRow(expiry_group)
+        inventory_layout.addWidget(expiry_group)
         
-        inventory_tab.setLayout(inventory_layout)
+        inventory_layout.addStretch()
         
-        # Tab 4: Description & SEO
-        desc_tab = QWidget()
+        return inventory_layout
+    
+    def _build_desc_tab(self):
+        """Build the Description & SEO tab layout."""
         desc_layout = QVBoxLayout()
         
         # Description Group
         desc_group = QGroupBox("Descriptions")
         desc_group_layout = QVBoxLayout()
         
-        desc_label = QLabel(self.translator.get('description') + ":")
+        desc_label = QLabel(self._t['description'] + ":")
         self.desc_input = QTextEdit()
         self.desc_input.setMaximumHeight(150)
         
-        short_desc_label = QLabel(self.translator.get('short_description') + ":")
+        short_desc_label = QLabel(self._t['short_description'] + ":")
         self.short_desc_input = QTextEdit()
         self.short_desc_input.setMaximumHeight(100)
         
@@ -363,11 +722,12 @@ class ProductFormDialog(QDialog):
         desc_layout.addWidget(seo_group)
         
         desc_layout.addStretch()
-        desc_tab.setLayout(desc_layout)
         
-        # Tab 5: Additional Information
-        additional_tab = QWidget()
-        additional_layout = QFormLayout()
+        return desc_layout
+    
+    def _build_additional_tab(self):
+        """Build the Additional Information tab layout."""
+        additional_layout = QVBoxLayout()
         
         # Warranty Group
         warranty_group = QGroupBox("Warranty & Support")
@@ -391,7 +751,7 @@ class ProductFormDialog(QDialog):
         warranty_layout.addRow("Support Phone:", self.support_phone_input)
         
         warranty_group.setLayout(warranty_layout)
-        additional_layout.addRow(warranty_group)
+        additional_layout.addWidget(warranty_group)
         
         # Supplier Group
         supplier_group = QGroupBox("Supplier Information")
@@ -401,25 +761,24 @@ class ProductFormDialog(QDialog):
         self.supplier_combo = QComboBox()
         self.supplier_combo.addItem("Select Supplier", 0)
         
-        try:
-            suppliers = self.db.execute_query("SELECT id, name FROM wholesale_partners WHERE status = 'active' ORDER BY name")
-            for supplier in suppliers:
-                self.supplier_combo.addItem(supplier['name'], supplier['id'])
-        except:
-            pass
+        suppliers = self._get_suppliers()
+        if suppliers:
+            self.supplier_combo.blockSignals(True)
+            self.supplier_combo.addItems([name for _, name in suppliers])
+            for index, (supplier_id, _) in enumerate(suppliers, start=1):
+                self.supplier_combo.setItemData(index, supplier_id)
+            self.supplier_combo.blockSignals(False)
         
         supplier_layout.addRow("Supplier:", self.supplier_combo)
         
         self.supplier_sku_input = QLineEdit()
         supplier_layout.addRow("Supplier SKU:", self.supplier_sku_input)
         
-        self.lead_time_input = QSpinBox()
-        self.lead_time_input.setRange(0, 365)
-        self.lead_time_input.setSuffix(" days")
+        self.lead_time_input = self._days_spin(365)
         supplier_layout.addRow("Lead Time:", self.lead_time_input)
         
         supplier_group.setLayout(supplier_layout)
-        additional_layout.addRow(supplier_group)
+        additional_layout.addWidget(supplier_group)
         
         # Shipping Group
         shipping_group = QGroupBox("Shipping")
@@ -432,263 +791,124 @@ class ProductFormDialog(QDialog):
         self.shipping_class_input = QLineEdit()
         shipping_layout.addRow("Shipping Class:", self.shipping_class_input)
         
-        self.shipping_weight_input = QDoubleSpinBox()
-        self.shipping_weight_input.setRange(0.000, 999.999)
-        self.shipping_weight_input.setDecimals(3)
-        self.shipping_weight_input.setSuffix(" kg")
+        self.shipping_weight_input = self._unit_spin(999.999, 3, " kg")
         shipping_layout.addRow("Shipping Weight:", self.shipping_weight_input)
         
         shipping_group.setLayout(shipping_layout)
-        additional_layout.addRow(shipping_group)
-        
-        additional_tab.setLayout(additional_layout)
-        
-        # Add all tabs
-        tabs.addTab(basic_tab, "Basic")
-        tabs.addTab(pricing_tab, "Pricing")
-        tabs.addTab(inventory_tab, "Inventory")
-        tabs.addTab(desc_tab, "Description & SEO")
-        tabs.addTab(additional_tab, "Additional")
-        
-        layout.addWidget(tabs)
-        
-        # Status & Actions
-        status_layout = QHBoxLayout()
-        
-        self.active_checkbox = QCheckBox(self.translator.get('active'))
-        self.active_checkbox.setChecked(True)
-        
-        self.featured_checkbox = QCheckBox("Featured Product")
-        
-        status_layout.addWidget(self.active_checkbox)
-        status_layout.addWidget(self.featured_checkbox)
-        status_layout.addStretch()
-        
-        layout.addLayout(status_layout)
-        
-        # Buttons
-        button_layout = QHBoxLayout()
-        
-        self.save_btn = QPushButton(self.translator.get('save'))
-        self.save_btn.setObjectName("primary")
-        self.save_btn.clicked.connect(self.on_save)
-        
-        self.cancel_btn = QPushButton(self.translator.get('cancel'))
-        self.cancel_btn.clicked.connect(self.reject)
-        
-        button_layout.addStretch()
-        button_layout.addWidget(self.save_btn)
-        button_layout.addWidget(self.cancel_btn)
+        additional_layout.addWidget(shipping_group)
         
-        layout.addLayout(button_layout)
+        additional_layout.addStretch()
         
-        self.setLayout(layout)
+        return additional_layout
     
     def load_existing_data(self):
         """Load existing product data into ALL form fields (SAFE VERSION)."""
         if not self.product_data:
             return
         
-        # Helper function to safely convert to float
-        def safe_float(value, default=0.0):
-            try:
-                return float(value) if value is not None else default
-            except (ValueError, TypeError):
-                return default
+        widgets = self._bound_widgets()
         
-        # Helper function to safely convert to int
-        def safe_int(value, default=0):
-            try:
-                return int(value) if value is not None else default
-            except (ValueError, TypeError):
-                return default
-        
-        # Helper function to get string or empty
-        def safe_str(value):
-            return str(value) if value is not None else ""
-        
-        # Basic Tab
-        self.name_input.setText(safe_str(self.product_data.get('name')))
-        self.sku_input.setText(safe_str(self.product_data.get('sku')))
-        self.barcode_input.setText(safe_str(self.product_data.get('barcode')))
-        
-        product_type = self.product_data.get('type', 'simple')
-        index = self.type_combo.findText(product_type)
-        if index >= 0:
-            self.type_combo.setCurrentIndex(index)
-        
-        self.category_input.setText(safe_str(self.product_data.get('category')))
-        self.subcategory_input.setText(safe_str(self.product_data.get('subcategory')))
-        self.brand_input.setText(safe_str(self.product_data.get('brand')))
-        self.manufacturer_input.setText(safe_str(self.product_data.get('manufacturer')))
-        self.country_input.setText(safe_str(self.product_data.get('country_of_origin')))
-        self.upc_input.setText(safe_str(self.product_data.get('upc')))
-        self.isbn_input.setText(safe_str(self.product_data.get('isbn')))
-        self.mpn_input.setText(safe_str(self.product_data.get('mpn')))
-        self.product_code_input.setText(safe_str(self.product_data.get('product_code')))
-        
-        # Pricing Tab
-        self.price_input.setValue(safe_float(self.product_data.get('price', 0.00)))
-        self.cost_input.setValue(safe_float(self.product_data.get('cost_price', 0.00)))
-        self.wholesale_input.setValue(safe_float(self.product_data.get('wholesale_price', 0.00)))
-        self.suggested_price_input.setValue(safe_float(self.product_data.get('suggested_retail_price', 0.00)))
-        self.sale_price_input.setValue(safe_float(self.product_data.get('sale_price', 0.00)))
-        self.sale_start_input.setText(safe_str(self.product_data.get('sale_start_date')))
-        self.sale_end_input.setText(safe_str(self.product_data.get('sale_end_date')))
-        
-        tax_class = self.product_data.get('tax_class', 'standard')
-        index = self.tax_combo.findText(tax_class)
-        if index >= 0:
-            self.tax_combo.setCurrentIndex(index)
-        
-        self.tax_rate_input.setValue(safe_float(self.product_data.get('tax_rate', 15.00)))
-        self.taxable_check.setChecked(bool(self.product_data.get('is_taxable', True)))
-        
-        # Inventory Tab
-        self.stock_input.setValue(safe_int(self.product_data.get('stock_quantity', 0)))
-        self.low_stock_input.setValue(safe_int(self.product_data.get('low_stock_threshold', 5)))
-        self.manage_stock_check.setChecked(bool(self.product_data.get('manage_stock', True)))
-        self.allow_backorders_check.setChecked(bool(self.product_data.get('allow_backorders', False)))
-        self.weight_input.setValue(safe_float(self.product_data.get('weight_kg', 0.000)))
-        self.length_input.setValue(safe_float(self.product_data.get('length_cm', 0.00)))
-        self.width_input.setValue(safe_float(self.product_data.get('width_cm', 0.00)))
-        self.height_input.setValue(safe_float(self.product_data.get('height_cm', 0.00)))
-        self.volume_input.setValue(safe_float(self.product_data.get('volume_liters', 0.000)))
-        self.shelf_life_input.setValue(safe_int(self.product_data.get('shelf_life_days', 0)))
-        self.expiry_alert_input.setValue(safe_int(self.product_data.get('expiry_alert_days', 30)))
-        self.batch_tracking_check.setChecked(bool(self.product_data.get('batch_tracking_required', False)))
-        self.serial_tracking_check.setChecked(bool(self.product_data.get('serial_tracking_required', False)))
-        
-        # Description & SEO Tab
-        self.desc_input.setText(safe_str(self.product_data.get('description')))
-        self.short_desc_input.setText(safe_str(self.product_data.get('short_description')))
-        self.meta_title_input.setText(safe_str(self.product_data.get('meta_title')))
-        self.meta_desc_input.setText(safe_str(self.product_data.get('meta_description')))
-        self.meta_keywords_input.setText(safe_str(self.product_data.get('meta_keywords')))
-        
-        # Additional Tab
-        self.warranty_period_input.setValue(safe_int(self.product_data.get('warranty_period_months', 0)))
-        self.warranty_type_input.setText(safe_str(self.product_data.get('warranty_type')))
-        self.has_warranty_check.setChecked(bool(self.product_data.get('has_warranty', False)))
-        self.support_email_input.setText(safe_str(self.product_data.get('support_email')))
-        self.support_phone_input.setText(safe_str(self.product_data.get('support_phone')))
-        
-        supplier_id = self.product_data.get('supplier_id')
-        if supplier_id:
-            index = self.supplier_combo.findData(supplier_id)
-            if index >= 0:
-                self.supplier_combo.setCurrentIndex(index)
-        
-        self.supplier_sku_input.setText(safe_str(self.product_data.get('supplier_sku')))
-        self.lead_time_input.setValue(safe_int(self.product_data.get('lead_time_days', 0)))
-        self.requires_shipping_check.setChecked(bool(self.product_data.get('requires_shipping', True)))
-        self.shipping_class_input.setText(safe_str(self.product_data.get('shipping_class')))
-        self.shipping_weight_input.setValue(safe_float(self.product_data.get('shipping_weight', 0.000)))
+        # Populate every field before Qt repaints the dialog, without
+        # emitting a change signal per assignment
+        self.setUpdatesEnabled(False)
+        for widget in widgets:
+            widget.blockSignals(True)
+        try:
+            for spec, widget in zip(self.FIELDS, widgets):
+                self._load_field(spec, widget)
+        finally:
+            for widget in widgets:
+                widget.blockSignals(False)
+            self.setUpdatesEnabled(True)
+        
+        # The widgets now hold the values; keep only the key for updates so
+        # large text fields are not held twice for the dialog's lifetime
+        self.product_data = {'id': self.product_data.get('id')}
+    
+    def _bound_widgets(self):
+        """
+        Get the widgets bound by FIELDS, in table order.
         
-        # Status
-        self.active_checkbox.setChecked(bool(self.product_data.get('is_active', True)))
-        self.featured_checkbox.setChecked(bool(self.product_data.get('is_featured', False)))
+        Builds any remaining tabs the first time it is called; the tuple is
+        then reused by every later load and save.
+        
+        Returns:
+            Tuple of widgets parallel to FIELDS
+        """
+        if self._field_widgets is None:
+            self._ensure_all_tabs()
+            self._field_widgets = tuple(getattr(self, spec[1]) for spec in self.FIELDS)
+        return self._field_widgets
     
-    def get_form_data(self):
-        """Get data from ALL form fields (SAFE VERSION)."""
-        def safe_float(value):
-            try:
-                return float(value) if value > 0 else None
-            except (ValueError, TypeError):
-                return None
+    def _load_field(self, spec, widget):
+        """
+        Copy one product_data value into its widget.
         
-        return {
-            # Basic Information
-            'name': self.name_input.text().strip(),
-            'sku': self.sku_input.text().strip() or None,
-            'barcode': self.barcode_input.text().strip() or None,
-            'type': self.type_combo.currentText(),
-            'category': self.category_input.text().strip() or None,
-            'subcategory': self.subcategory_input.text().strip() or None,
-            'brand': self.brand_input.text().strip() or None,
-            'manufacturer': self.manufacturer_input.text().strip() or None,
-            'country_of_origin': self.country_input.text().strip() or None,
-            'upc': self.upc_input.text().strip() or None,
-            'isbn': self.isbn_input.text().strip() or None,
-            'mpn': self.mpn_input.text().strip() or None,
-            'product_code': self.product_code_input.text().strip() or None,
-            
-            # Pricing
-            'price': float(self.price_input.value()),
-            'cost_price': safe_float(self.cost_input.value()),
-            'wholesale_price': safe_float(self.wholesale_input.value()),
-            'suggested_retail_price': safe_float(self.suggested_price_input.value()),
-            'sale_price': safe_float(self.sale_price_input.value()),
-            'sale_start_date': self.sale_start_input.text().strip() or None,
-            'sale_end_date': self.sale_end_input.text().strip() or None,
-            'tax_class': self.tax_combo.currentText(),
-            'tax_rate': float(self.tax_rate_input.value()),
-            'is_taxable': self.taxable_check.isChecked(),
-            
-            # Inventory
-            'stock_quantity': self.stock_input.value(),
-            'stock_status': 'instock' if self.stock_input.value() > 0 else 'outofstock',
-            'low_stock_threshold': self.low_stock_input.value(),
-            'manage_stock': self.manage_stock_check.isChecked(),
-            'allow_backorders': self.allow_backorders_check.isChecked(),
-            'weight_kg': safe_float(self.weight_input.value()),
-            'length_cm': safe_float(self.length_input.value()),
-            'width_cm': safe_float(self.width_input.value()),
-            'height_cm': safe_float(self.height_input.value()),
-            'volume_liters': safe_float(self.volume_input.value()),
-            'dimensions_unit': 'cm',
-            'shelf_life_days': self.shelf_life_input.value(),
-            'expiry_alert_days': self.expiry_alert_input.value(),
-            'batch_tracking_required': self.batch_tracking_check.isChecked(),
-            'serial_tracking_required': self.serial_tracking_check.isChecked(),
-            
-            # Description & SEO
-            'description': self.desc_input.toPlainText().strip() or None,
-            'short_description': self.short_desc_input.toPlainText().strip() or None,
-            'meta_title': self.meta_title_input.text().strip() or None,
-            'meta_description': self.meta_desc_input.toPlainText().strip() or None,
-            'meta_keywords': self.meta_keywords_input.text().strip() or None,
-            
-            # Additional
-            'warranty_period_months': self.warranty_period_input.value(),
-            'warranty_type': self.warranty_type_input.text().strip() or None,
-            'has_warranty': self.has_warranty_check.isChecked(),
-            'support_email': self.support_email_input.text().strip() or None,
-            'support_phone': self.support_phone_input.text().strip() or None,
-            'supplier_id': self.supplier_combo.currentData() if self.supplier_combo.currentData() > 0 else None,
-            'supplier_sku': self.supplier_sku_input.text().strip() or None,
-            'lead_time_days': self.lead_time_input.value(),
-            'requires_shipping': self.requires_shipping_check.isChecked(),
-            'shipping_class': self.shipping_class_input.text().strip() or None,
-            'shipping_weight': safe_float(self.shipping_weight_input.value()),
-            'is_virtual': False,
-            'is_downloadable': False,
+        Args:
+            spec: (data key, widget attribute, kind, default) entry of FIELDS
+            widget: Widget bound to spec
+        """
+        key, _, kind, default = spec
+        value = self.product_data.get(key)
+        if value is None:
+            value = default
+        self._LOADERS[kind](widget, value)
+    
+    def _dump_field(self, spec, widget):
+        """
+        Read one form value from its widget.
+        
+        Args:
+            spec: (data key, widget attribute, kind, default) entry of FIELDS
+            widget: Widget bound to spec
             
-            # Status
-            'is_active': self.active_checkbox.isChecked(),
-            'is_featured': self.featured_checkbox.isChecked(),
+        Returns:
+            Value to store under the spec's data key
+        """
+        return self._DUMPERS[spec[2]](widget)
+    
+    def get_form_data(self):
+        """Get data from ALL form fields (SAFE VERSION)."""
+        data = {
+            spec[0]: self._dump_field(spec, widget)
+            for spec, widget in zip(self.FIELDS, self._bound_widgets())
         }
+        data['stock_status'] = 'instock' if data['stock_quantity'] > 0 else 'outofstock'
+        data['dimensions_unit'] = 'cm'
+        data['is_virtual'] = False
+        data['is_downloadable'] = False
+        return data
     
     def validate_form(self):
         """Validate form data."""
         data = self.get_form_data()
+        # Kept for get_result; the dialog closes right after a valid save,
+        # and a failed validation is re-read on the next attempt
+        self._last_form_data = data
         
         # Required fields
         if not data['name']:
             QMessageBox.warning(self, "Validation Error", 
-                               self.translator.get('product_name') + " is required.")
+                               self._t['product_name'] + " is required.")
             return False
         
         if data['price'] <= 0:
             QMessageBox.warning(self, "Validation Error", 
-                               self.translator.get('price') + " must be greater than 0.")
+                               self._t['price'] + " must be greater than 0.")
             return False
         
         if data['stock_quantity'] < 0:
             QMessageBox.warning(self, "Validation Error", 
-                               self.translator.get('stock_quantity') + " cannot be negative.")
+                               self._t['stock_quantity'] + " cannot be negative.")
             return False
         
+        for key, label in (('sale_start_date', "Sale Start Date"),
+                           ('sale_end_date', "Sale End Date")):
+            if data[key] and not _DATE_RE.match(data[key]):
+                QMessageBox.warning(self, "Validation Error",
+                                   label + " must be in YYYY-MM-DD format.")
+                return False
+        
         return True
     
     def on_save(self):
@@ -700,9 +920,13 @@ class ProductFormDialog(QDialog):
     
     def get_result(self):
         """Get the result data from dialog."""
+        data = self._last_form_data
+        if data is None:
+            data = self.get_form_data()
+        
         return {
             'success': True,
-            'data': self.get_form_data()
+            'data': data
         }
 
 
@@ -737,47 +961,39 @@ class VariationsViewDialog(QDialog):
     
     def setup_ui(self):
         """Setup the user interface."""
+        t = self.translator.get
+        
         layout = QVBoxLayout()
         
         # Product info
         info_layout = QHBoxLayout()
         
-        # Get product name for display
-        query = "SELECT name FROM products WHERE id = ?"
-        result = self.product_controller.db.execute_query(query, (self.product_id,))
-        product_name = result[0]['name'] if result else f"Product #{self.product_id}"
-        
-        name_label = QLabel(f"<b>{product_name}</b> (ID: {self.product_id})")
-        info_layout.addWidget(name_label)
+        # Filled in by load_variations from the same query as the rows
+        self.name_label = QLabel(f"<b>Product #{self.product_id}</b> (ID: {self.product_id})")
+        info_layout.addWidget(self.name_label)
         info_layout.addStretch()
         
         layout.addLayout(info_layout)
         
         # Variations table
-        self.variations_table = QTableWidget()
-        self.variations_table.setColumnCount(7)
-        self.variations_table.setHorizontalHeaderLabels([
-            self.translator.get('name'),
-            self.translator.get('sku'),
-            self.translator.get('price'),
-            self.translator.get('cost_price'),
-            self.translator.get('stock_quantity'),
-            self.translator.get('status'),
-            self.translator.get('created')
-        ])
+        self.variations_model = VariationsTableModel(self.translator, self)
+        self.variations_table = QTableView()
+        self.variations_table.setModel(self.variations_model)
         
-        # Configure table
+        # Configure table with explicit column widths and fixed row heights,
+        # as for the products table, so cell contents are never measured
         header = self.variations_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(5, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(6, QHeaderView.ResizeMode.ResizeToContents)
+        for column, width in ((1, 120), (2, 90), (3, 90), (4, 90), (5, 80), (6, 100)):
+            self.variations_table.setColumnWidth(column, width)
+        
+        vertical_header = self.variations_table.verticalHeader()
+        vertical_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vertical_header.setDefaultSectionSize(28)
         
         self.variations_table.setAlternatingRowColors(True)
-        self.variations_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.variations_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         
         layout.addWidget(self.variations_table)
         
@@ -796,7 +1012,7 @@ class VariationsViewDialog(QDialog):
         layout.addLayout(stats_layout)
         
         # Close button
-        close_btn = QPushButton(self.translator.get('close'))
+        close_btn = QPushButton(t('close'))
         close_btn.clicked.connect(self.accept)
         button_layout = QHBoxLayout()
         button_layout.addStretch()
@@ -806,6 +1022,17 @@ class VariationsViewDialog(QDialog):
         
         self.setLayout(layout)
     
+    def set_product_id(self, product_id):
+        """
+        Show another product's variations, reusing the existing widgets.
+        
+        Args:
+            product_id: Product ID
+        """
+        self.product_id = product_id
+        self.name_label.setText(f"<b>Product #{product_id}</b> (ID: {product_id})")
+        self.load_variations()
+    
     def load_variations(self):
         """Load variations from database."""
         result = self.product_controller.get_product_variations(self.product_id)
@@ -814,135 +1041,596 @@ class VariationsViewDialog(QDialog):
             QMessageBox.warning(self, "Error", result['message'])
             return
         
-        variations = result['variations']
-        
-        # Update table
-        self.variations_table.setRowCount(len(variations))
+        self.name_label.setText(f"<b>{result['product_name']}</b> (ID: {self.product_id})")
         
-        total_stock = 0
-        active_count = 0
+        variations = result['variations']
+        self.variations_model.set_variations(variations)
         
-        for row, variation in enumerate(variations):
-            # Name
-            name_item = QTableWidgetItem(variation['name'])
-            self.variations_table.setItem(row, 0, name_item)
-            
-            # SKU
-            sku_item = QTableWidgetItem(variation['sku'] or "")
-            self.variations_table.setItem(row, 1, sku_item)
-            
-            # Price
-            price_item = QTableWidgetItem(f"${variation['price']:.2f}")
-            self.variations_table.setItem(row, 2, price_item)
-            
-            # Cost Price
-            cost_price = variation.get('cost_price')
-            cost_item = QTableWidgetItem(f"${cost_price:.2f}" if cost_price else "")
-            self.variations_table.setItem(row, 3, cost_item)
-            
-            # Stock Quantity
-            stock_qty = variation.get('stock_quantity', 0)
-            stock_item = QTableWidgetItem(str(stock_qty))
-            
-            # Color code based on stock
-            if stock_qty <= variation.get('low_stock_threshold', 5):
-                stock_item.setForeground(QColor('#f39c12'))
-            elif stock_qty == 0:
-                stock_item.setForeground(QColor('#e74c3c'))
-            
-            self.variations_table.setItem(row, 4, stock_item)
-            total_stock += stock_qty
-            
-            # Status
-            status_text = self.translator.get('active') if variation['is_active'] else self.translator.get('inactive')
-            status_item = QTableWidgetItem(status_text)
-            status_item.setForeground(QColor('#27ae60') if variation['is_active'] else QColor('#7f8c8d'))
-            self.variations_table.setItem(row, 5, status_item)
-            
-            if variation['is_active']:
-                active_count += 1
-            
-            # Created date
-            created_date = variation['created_at'][:10] if variation.get('created_at') else ""
-            created_item = QTableWidgetItem(created_date)
-            self.variations_table.setItem(row, 6, created_item)
+        total_stock = sum(variation.get('stock_quantity') or 0 for variation in variations)
+        active_count = sum(1 for variation in variations if variation['is_active'])
         
         # Update statistics
         self.total_label.setText(f"Total variations: {len(variations)}")
         self.active_label.setText(f"Active: {active_count}")
         self.total_stock_label.setText(f"Total stock: {total_stock}")
 
-class ProductScreen(QWidget):
-    """Product management screen for Twinx POS."""
+
+class VariationsTableModel(QAbstractTableModel):
+    """Read-only table model over the rows of get_product_variations.
     
-    # Signals
-    product_selected = pyqtSignal(int)  # Emitted when product is selected
-    refresh_requested = pyqtSignal()    # Emitted when data needs refresh
+    Display text is formatted once per row when the variations are set, so
+    data() only indexes into the stored tuples and no per-cell item objects
+    are created.
+    """
     
-    def __init__(self, db_manager, translation_manager):
+    # Translation keys of the column headers, in column order
+    HEADER_KEYS = ('name', 'sku', 'price', 'cost_price', 'stock_quantity', 'status', 'created')
+    
+    STOCK_COLUMN = 4
+    STATUS_COLUMN = 5
+    
+    LOW_STOCK_BRUSH = QBrush(QColor('#f39c12'))
+    OUT_OF_STOCK_BRUSH = QBrush(QColor('#e74c3c'))
+    ACTIVE_BRUSH = QBrush(QColor('#27ae60'))
+    INACTIVE_BRUSH = QBrush(QColor('#7f8c8d'))
+    
+    def __init__(self, translation_manager, parent=None):
         """
-        Initialize product screen.
+        Initialize the model.
         
         Args:
-            db_manager: DatabaseManager instance
-            translation_manager: TranslationManager instance
+            translation_manager: Translation manager for headers and status text
+            parent: Parent object
         """
-        super().__init__()
-        
-        self.db_manager = db_manager
+        super().__init__(parent)
         self.translation_manager = translation_manager
-        self.product_controller = ProductController(db_manager)
-        
-        self.current_language = self.translation_manager.get_current_lang()
-        self.current_product_id = None
-        
-        self.setup_ui()
-        self.load_initial_data()
+        self._rows = []
+        self._stock_brushes = []
+        self._active = []
     
-    def setup_ui(self):
-        """Setup the user interface."""
-        self.setObjectName("productScreen")
-        
-        # Main layout
-        main_layout = QVBoxLayout()
-        main_layout.setContentsMargins(20, 20, 20, 20)
-        main_layout.setSpacing(15)
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADER_KEYS)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
         
-        # Header with title and actions
-        header_frame = QFrame()
-        header_frame.setObjectName("headerFrame")
-        header_layout = QHBoxLayout()
-        header_layout.setContentsMargins(0, 0, 0, 0)
+        row = index.row()
+        column = index.column()
         
-        # Title
-        title_label = QLabel(self.translation_manager.get('products'))
-        title_label.setObjectName("pageTitle")
-        title_font = QFont()
-        title_font.setPointSize(18)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._rows[row][column]
         
-        # Action buttons
-        button_layout = QHBoxLayout()
-        button_layout.setSpacing(10)
+        elif role == Qt.ItemDataRole.ForegroundRole:
+            if column == self.STOCK_COLUMN:
+                return self._stock_brushes[row]
+            if column == self.STATUS_COLUMN:
+                return self.ACTIVE_BRUSH if self._active[row] else self.INACTIVE_BRUSH
         
-        self.new_product_btn = QPushButton(f"➕ {self.translation_manager.get('add_new')}")
-        self.new_product_btn.setObjectName("primary")
-        self.new_product_btn.clicked.connect(self.on_new_product)
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.translation_manager.get(self.HEADER_KEYS[section])
+        return None
+    
+    def set_variations(self, variations):
+        """Replace the displayed rows."""
+        active_text = self.translation_manager.get('active')
+        inactive_text = self.translation_manager.get('inactive')
+        
+        # All display text is built in bulk comprehensions before the reset
+        active = [bool(variation['is_active']) for variation in variations]
+        stocks = [variation.get('stock_quantity') or 0 for variation in variations]
+        thresholds = [variation.get('low_stock_threshold') for variation in variations]
+        cost_prices = [variation.get('cost_price') for variation in variations]
+        
+        rows = [
+            (
+                variation['name'],
+                variation['sku'] or "",
+                f"${variation['price']:.2f}",
+                f"${cost_price:.2f}" if cost_price else "",
+                str(stock_qty),
+                active_text if is_active else inactive_text,
+                variation['created_at'][:10] if variation.get('created_at') else ""
+            )
+            for variation, cost_price, stock_qty, is_active in zip(variations, cost_prices, stocks, active)
+        ]
         
-        self.refresh_btn = QPushButton(f"🔄 {self.translation_manager.get('refresh')}")
-        self.refresh_btn.setObjectName("secondary")
-        self.refresh_btn.clicked.connect(self.on_refresh)
+        # Color code based on stock; out of stock is checked first, since
+        # zero is also at or under any low-stock threshold
+        stock_brushes = [
+            self.OUT_OF_STOCK_BRUSH if stock_qty == 0
+            else self.LOW_STOCK_BRUSH if stock_qty <= (5 if threshold is None else threshold)
+            else None
+            for stock_qty, threshold in zip(stocks, thresholds)
+        ]
         
-        self.export_btn = QPushButton(f"📤 {self.translation_manager.get('export')}")
-        self.export_btn.setObjectName("secondary")
-        self.export_btn.clicked.connect(self.on_export)
+        self.beginResetModel()
+        self._rows = rows
+        self._stock_brushes = stock_brushes
+        self._active = active
+        self.endResetModel()
+
+
+class ProductTableModel(QAbstractTableModel):
+    """Table model over the product rows returned by search_products.
+    
+    The view asks only for the cells it paints, so no per-cell item objects
+    are created when products are loaded. Rows arrive in batches: when the
+    view scrolls near the end, fetch_more_requested asks the owner for the
+    batch starting at the given offset.
+    
+    Rows are stored column-wise: the display text of each text column is
+    computed once per row on load, so data() is a plain list lookup. IDs
+    and the numbers used for coloring live in typed arrays (8 bytes per
+    value instead of a Python int/float object each).
+    """
+    
+    fetch_more_requested = pyqtSignal(int)
+    
+    # Translation keys of the column headers, in column order
+    HEADER_KEYS = ('product_name', 'sku', 'price', 'stock_quantity', 'category', 'status')
+    
+    STOCK_COLUMN = 3
+    STATUS_COLUMN = 5
+    
+    LOW_STOCK_BRUSH = QBrush(QColor('#f39c12'))
+    OUT_OF_STOCK_BRUSH = QBrush(QColor('#e74c3c'))
+    IN_STOCK_BRUSH = QBrush(QColor('#27ae60'))
+    ACTIVE_BRUSH = QBrush(QColor('#27ae60'))
+    INACTIVE_BRUSH = QBrush(QColor('#7f8c8d'))
+    
+    def __init__(self, translation_manager, parent=None):
+        """
+        Initialize the model.
         
-        button_layout.addWidget(self.new_product_btn)
-        button_layout.addWidget(self.refresh_btn)
-        button_layout.addWidget(self.export_btn)
+        Args:
+            translation_manager: Translation manager for headers and status text
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self.translation_manager = translation_manager
+        self._has_more = False
+        self._fetching = False
+        self._clear_rows()
+        self._status_text = self._translate_status()
+    
+    def _clear_rows(self):
+        """Reset the per-column row storage."""
+        self._ids = array('q')
+        # Display text of every column before STATUS_COLUMN
+        self._text = tuple([] for _ in range(self.STATUS_COLUMN))
+        self._stock = array('d')
+        self._low_stock_threshold = array('d')
+        self._active = bytearray()
+    
+    def _add_rows(self, products):
+        """Split product dicts into the per-column lists."""
+        names, skus, prices, stocks, categories = self._text
+        
+        # One comprehension per column instead of eight appends per row
+        stock_values = [product.get('total_stock') or 0 for product in products]
+        thresholds = [product.get('low_stock_threshold') for product in products]
+        
+        self._ids.extend([product['id'] for product in products])
+        names.extend([product['name'] for product in products])
+        skus.extend([product['sku'] or "" for product in products])
+        prices.extend([product.get('display_price', 'N/A') for product in products])
+        stocks.extend([str(stock_qty) for stock_qty in stock_values])
+        categories.extend([
+            product.get('category_name') or product['category'] or "" for product in products
+        ])
         
-        header_layout.addWidget(title_label)
+        self._stock.extend(stock_values)
+        self._low_stock_threshold.extend([5 if threshold is None else threshold for threshold in thresholds])
+        self._active.extend([1 if product['is_active'] else 0 for product in products])
+    
+    def _translate_status(self):
+        """Return the (inactive, active) status labels in the current language."""
+        return (self.translation_manager.get('inactive'), self.translation_manager.get('active'))
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._ids)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADER_KEYS)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        row = index.row()
+        column = index.column()
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == self.STATUS_COLUMN:
+                return self._status_text[self._active[row]]
+            return self._text[column][row]
+        
+        elif role == Qt.ItemDataRole.ForegroundRole:
+            if column == self.STOCK_COLUMN:
+                # Color code based on stock level (out of stock first, as
+                # zero is also at or under the low-stock threshold)
+                stock_qty = self._stock[row]
+                if stock_qty == 0:
+                    return self.OUT_OF_STOCK_BRUSH
+                elif stock_qty <= self._low_stock_threshold[row]:
+                    return self.LOW_STOCK_BRUSH
+                return self.IN_STOCK_BRUSH
+            if column == self.STATUS_COLUMN:
+                return self.ACTIVE_BRUSH if self._active[row] else self.INACTIVE_BRUSH
+        
+        elif role == Qt.ItemDataRole.UserRole:
+            return self._ids[row]
+        
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.translation_manager.get(self.HEADER_KEYS[section])
+        return None
+    
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._has_more and not self._fetching
+    
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        self._fetching = True
+        self.fetch_more_requested.emit(len(self._ids))
+    
+    def set_products(self, products, has_more=False):
+        """Replace the displayed rows."""
+        self.beginResetModel()
+        self._clear_rows()
+        self._add_rows(products)
+        self._has_more = has_more
+        self._fetching = False
+        self.endResetModel()
+    
+    def append_products(self, products, has_more):
+        """Append a fetched batch of rows."""
+        if products:
+            first = len(self._ids)
+            self.beginInsertRows(QModelIndex(), first, first + len(products) - 1)
+            self._add_rows(products)
+            self.endInsertRows()
+        self._has_more = has_more
+        self._fetching = False
+    
+    def update_row(self, row, product):
+        """Replace one row with a fresh product dict and repaint only that row."""
+        stock_qty = product.get('total_stock') or 0
+        threshold = product.get('low_stock_threshold')
+        names, skus, prices, stocks, categories = self._text
+        
+        names[row] = product['name']
+        skus[row] = product['sku'] or ""
+        prices[row] = product.get('display_price', 'N/A')
+        stocks[row] = str(stock_qty)
+        categories[row] = product.get('category_name') or product['category'] or ""
+        
+        self._stock[row] = stock_qty
+        self._low_stock_threshold[row] = 5 if threshold is None else threshold
+        self._active[row] = 1 if product['is_active'] else 0
+        
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADER_KEYS) - 1))
+    
+    def remove_row(self, row):
+        """Remove one row."""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._ids[row]
+        for column in self._text:
+            del column[row]
+        del self._stock[row]
+        del self._low_stock_threshold[row]
+        del self._active[row]
+        self.endRemoveRows()
+    
+    def find_row(self, product_id):
+        """Return the row showing the given product ID, or -1 if it is not loaded."""
+        try:
+            return self._ids.index(product_id)
+        except ValueError:
+            return -1
+    
+    def product_id(self, row):
+        """Return the product ID shown in the given row."""
+        return self._ids[row]
+    
+    def product_name(self, row):
+        """Return the product name shown in the given row."""
+        return self._text[0][row]
+    
+    def retranslate(self):
+        """Refresh headers and status text after a language change."""
+        self._status_text = self._translate_status()
+        self.headerDataChanged.emit(Qt.Orientation.Horizontal, 0, len(self.HEADER_KEYS) - 1)
+        if self._ids:
+            self.dataChanged.emit(
+                self.index(0, self.STATUS_COLUMN),
+                self.index(len(self._ids) - 1, self.STATUS_COLUMN)
+            )
+
+
+class ProductLoaderSignals(QObject):
+    """Signals for ProductLoader (a QRunnable cannot emit signals itself)."""
+    
+    results = pyqtSignal(int, object)  # (load token, search_products result)
+
+
+class ProductLoader(QRunnable):
+    """Runs a search_products call on a thread pool thread."""
+    
+    def __init__(self, product_controller, token, search_kwargs):
+        """
+        Initialize the loader.
+        
+        Args:
+            product_controller: ProductController instance
+            token: Load token echoed back with the results
+            search_kwargs: Keyword arguments for search_products
+        """
+        super().__init__()
+        self.product_controller = product_controller
+        self.token = token
+        self.search_kwargs = search_kwargs
+        self.signals = ProductLoaderSignals()
+    
+    def run(self):
+        try:
+            result = self.product_controller.search_products(**self.search_kwargs)
+        except Exception as e:
+            result = {'success': False, 'message': str(e), 'products': []}
+        self.signals.results.emit(self.token, result)
+
+
+class ProductExporterSignals(QObject):
+    """Signals for ProductExporter."""
+    
+    progress = pyqtSignal(int)  # Rows written so far
+    finished = pyqtSignal(str, object)  # (file path, export_products_csv result)
+
+
+class ProductExporter(QRunnable):
+    """Writes a product CSV export on a thread pool thread."""
+    
+    def __init__(self, product_controller, file_path, product_ids=None):
+        """
+        Initialize the exporter.
+        
+        Args:
+            product_controller: ProductController instance
+            file_path: Destination CSV path
+            product_ids: Products to export (None = all)
+        """
+        super().__init__()
+        self.product_controller = product_controller
+        self.file_path = file_path
+        self.product_ids = product_ids
+        self.signals = ProductExporterSignals()
+    
+    def run(self):
+        try:
+            result = self.product_controller.export_products_csv(
+                self.file_path, self.product_ids, progress_callback=self.signals.progress.emit
+            )
+        except Exception as e:
+            result = {'success': False, 'message': str(e)}
+        self.signals.finished.emit(self.file_path, result)
+
+
+class QueryRunnerSignals(QObject):
+    """Signals for QueryRunner."""
+    
+    finished = pyqtSignal(object)  # {'success', 'message', 'data'} result dict
+
+
+class QueryRunner(QRunnable):
+    """Runs a database read function on a thread pool thread.
+    
+    The function's return value is delivered on the GUI thread as the
+    'data' of a result dict; an exception becomes a failed result.
+    """
+    
+    def __init__(self, query_fn):
+        """
+        Initialize the runner.
+        
+        Args:
+            query_fn: Callable with no arguments that performs the query
+        """
+        super().__init__()
+        self.query_fn = query_fn
+        self.signals = QueryRunnerSignals()
+    
+    def run(self):
+        try:
+            result = {'success': True, 'message': '', 'data': self.query_fn()}
+        except Exception as e:
+            result = {'success': False, 'message': str(e), 'data': None}
+        self.signals.finished.emit(result)
+
+
+class StatsFrame(QFrame):
+    """Quick stats panel that signals the first time it is shown."""
+    
+    first_shown = pyqtSignal()
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._was_shown = False
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._was_shown:
+            self._was_shown = True
+            self.first_shown.emit()
+
+
+class ProductScreen(QWidget):
+    """Product management screen for Twinx POS."""
+    
+    # Signals
+    product_selected = pyqtSignal(int)  # Emitted when product is selected
+    refresh_requested = pyqtSignal()    # Emitted when data needs refresh
+    
+    # Every key update_language reads, fetched with one get_many call
+    LANGUAGE_KEYS = (
+        'products', 'add_new', 'refresh', 'export', 'search_products', 'search',
+        'product_details', 'edit', 'delete', 'variations', 'quick_stats',
+        'all_categories', 'all_stock', 'in_stock', 'low_stock', 'out_of_stock'
+    )
+    
+    def __init__(self, db_manager, translation_manager):
+        """
+        Initialize product screen.
+        
+        Args:
+            db_manager: DatabaseManager instance
+            translation_manager: TranslationManager instance
+        """
+        super().__init__()
+        
+        self.db_manager = db_manager
+        self.translation_manager = translation_manager
+        self.product_controller = ProductController(db_manager)
+        
+        # Translated strings by (language version, key), read through _tr;
+        # update_language bumps the version and clears the cache
+        self._tr_cache = {}
+        self._tr_lang_version = 0
+        
+        self.current_language = self.translation_manager.get_current_lang()
+        self.current_product_id = None
+        
+        # Product loads run on the thread pool; each load gets a new token and
+        # results (first batches and scroll batches) carrying an older one
+        # are dropped, so a slow query can never overwrite newer rows
+        self._load_token = 0
+        self._pending_filters = None
+        self._active_filters = None
+        self._select_after_load = None
+        self._last_query = None
+        
+        # Database queries and file I/O (exports) use separate pools so a
+        # long export never holds up a search
+        self.db_pool = QThreadPool(self)
+        self.db_pool.setMaxThreadCount(max(2, QThread.idealThreadCount() - 2))
+        self.io_pool = QThreadPool(self)
+        self.io_pool.setMaxThreadCount(4)
+        self._export_progress = None
+        
+        # When a DB load returns every match in one batch, narrower searches
+        # (same filters, longer text) are filtered from these rows in memory
+        self._base_products = []
+        self._base_filters = None
+        self._search_index = None  # lowercase haystack per base product
+        self._search_buffer = ''   # all haystacks joined by newlines
+        self._search_offsets = []  # start of each haystack in the buffer
+        
+        # First-batch results of short (1-3 character) searches, most
+        # recently used last; cleared by on_refresh
+        self._search_cache = OrderedDict()
+        
+        # Last stats counters (total, in stock, low stock, out of stock);
+        # marked dirty when this screen adds, edits or deletes a product
+        self._stats_cache = None
+        self._stats_cache_ts = 0.0
+        self._stats_dirty = True
+        self._stats_loading = False
+        self._stats_reload = False
+        
+        # Full row of the product shown in the details panel; on_edit_product
+        # reuses it while its updated_at is still current
+        self._details_product = None
+        
+        # Rendered details HTML by the displayed values (DETAILS_KEY_FIELDS
+        # and the variation count), most recently used last
+        self._details_html_cache = OrderedDict()
+        
+        # Variations dialog, created by the first on_view_variations and
+        # dropped on a language change
+        self._variations_dialog = None
+        
+        self.setup_ui()
+        
+        # Load data after the first paint so the screen shows immediately
+        QTimer.singleShot(0, self.load_initial_data)
+    
+    def _tr(self, key):
+        """Return the translation of key, cached until the language changes."""
+        cache_key = (self._tr_lang_version, key)
+        text = self._tr_cache.get(cache_key)
+        if text is None:
+            text = self._tr_cache[cache_key] = self.translation_manager.get(key)
+        return text
+    
+    def setup_ui(self):
+        """Setup the user interface."""
+        t = self._tr
+        
+        self.setObjectName("productScreen")
+        
+        # Main layout
+        main_layout = QVBoxLayout()
+        main_layout.setContentsMargins(20, 20, 20, 20)
+        main_layout.setSpacing(15)
+        
+        # Header with title and actions
+        header_frame = QFrame()
+        header_frame.setObjectName("headerFrame")
+        header_layout = QHBoxLayout()
+        header_layout.setContentsMargins(0, 0, 0, 0)
+        
+        # Title
+        self.title_label = QLabel(t('products'))
+        self.title_label.setObjectName("pageTitle")
+        title_font = QFont()
+        title_font.setPointSize(18)
+        title_font.setBold(True)
+        self.title_label.setFont(title_font)
+        
+        # Action buttons
+        button_layout = QHBoxLayout()
+        button_layout.setSpacing(10)
+        
+        # Icons come from the desktop theme, falling back to Qt's built-in
+        # set; they are rasterized once instead of shaping emoji on repaint
+        style = self.style()
+        icon_size = QSize(18, 18)
+        
+        self.new_product_btn = QPushButton(t('add_new'))
+        self.new_product_btn.setIcon(QIcon.fromTheme(
+            'list-add', style.standardIcon(QStyle.StandardPixmap.SP_FileIcon)))
+        self.new_product_btn.setIconSize(icon_size)
+        self.new_product_btn.setObjectName("primary")
+        self.new_product_btn.clicked.connect(self.on_new_product)
+        
+        self.refresh_btn = QPushButton(t('refresh'))
+        self.refresh_btn.setIcon(QIcon.fromTheme(
+            'view-refresh', style.standardIcon(QStyle.StandardPixmap.SP_BrowserReload)))
+        self.refresh_btn.setIconSize(icon_size)
+        self.refresh_btn.setObjectName("secondary")
+        self.refresh_btn.clicked.connect(self.on_refresh)
+        
+        self.export_btn = QPushButton(t('export'))
+        self.export_btn.setIcon(QIcon.fromTheme(
+            'document-save-as', style.standardIcon(QStyle.StandardPixmap.SP_DialogSaveButton)))
+        self.export_btn.setIconSize(icon_size)
+        self.export_btn.setObjectName("secondary")
+        self.export_btn.clicked.connect(self.on_export)
+        
+        button_layout.addWidget(self.new_product_btn)
+        button_layout.addWidget(self.refresh_btn)
+        button_layout.addWidget(self.export_btn)
+        
+        header_layout.addWidget(self.title_label)
         header_layout.addStretch()
         header_layout.addLayout(button_layout)
         header_frame.setLayout(header_layout)
@@ -955,31 +1643,45 @@ class ProductScreen(QWidget):
         
         self.search_input = QLineEdit()
         self.search_input.setObjectName("search")
-        self.search_input.setPlaceholderText(self.translation_manager.get('search_products'))
+        self.search_input.setPlaceholderText(t('search_products'))
+        # Typing searches after a short pause; Enter searches immediately
+        self.search_input.textChanged.connect(self.on_search_text_changed)
         self.search_input.returnPressed.connect(self.on_search)
         
-        search_btn = QPushButton(self.translation_manager.get('search'))
-        search_btn.setObjectName("primary")
-        search_btn.clicked.connect(self.on_search)
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(250)
+        self.search_timer.timeout.connect(self.on_search)
+        
+        self.search_btn = QPushButton(t('search'))
+        self.search_btn.setObjectName("primary")
+        self.search_btn.clicked.connect(self.on_search)
         
         # Filter dropdowns
         self.category_filter = QComboBox()
-        self.category_filter.addItem(self.translation_manager.get('all_categories'), 0)
+        self.category_filter.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
+        self.category_filter.addItem(t('all_categories'), 0)
         self.category_filter.currentIndexChanged.connect(self.on_filter_changed)
         
         self.stock_filter = QComboBox()
-        self.stock_filter.addItem(self.translation_manager.get('all_stock'), 'all')
-        self.stock_filter.addItem(self.translation_manager.get('in_stock'), 'in_stock')
-        self.stock_filter.addItem(self.translation_manager.get('low_stock'), 'low_stock')
-        self.stock_filter.addItem(self.translation_manager.get('out_of_stock'), 'out_of_stock')
+        self.stock_filter.addItem(t('all_stock'), 'all')
+        self.stock_filter.addItem(t('in_stock'), 'in_stock')
+        self.stock_filter.addItem(t('low_stock'), 'low_stock')
+        self.stock_filter.addItem(t('out_of_stock'), 'out_of_stock')
         self.stock_filter.currentIndexChanged.connect(self.on_filter_changed)
         
+        # Scrolling through a filter combo reloads once it settles
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(200)
+        self._reload_timer.timeout.connect(self.load_products)
+        
         search_layout.addWidget(self.search_input, stretch=2)
-        search_layout.addWidget(QLabel(self.translation_manager.get('category') + ":"))
+        search_layout.addWidget(QLabel(t('category') + ":"))
         search_layout.addWidget(self.category_filter)
-        search_layout.addWidget(QLabel(self.translation_manager.get('stock') + ":"))
+        search_layout.addWidget(QLabel(t('stock') + ":"))
         search_layout.addWidget(self.stock_filter)
-        search_layout.addWidget(search_btn)
+        search_layout.addWidget(self.search_btn)
         
         search_frame.setLayout(search_layout)
         
@@ -991,52 +1693,59 @@ class ProductScreen(QWidget):
         table_layout = QVBoxLayout()
         table_layout.setContentsMargins(0, 0, 0, 0)
         
-        self.products_table = QTableWidget()
+        self.product_model = ProductTableModel(self.translation_manager, self)
+        
+        self.products_table = QTableView()
         self.products_table.setObjectName("productsTable")
-        self.products_table.setColumnCount(6)
-        self.products_table.setHorizontalHeaderLabels([
-            self.translation_manager.get('product_name'),
-            self.translation_manager.get('sku'),
-            self.translation_manager.get('price'),
-            self.translation_manager.get('stock_quantity'),
-            self.translation_manager.get('category'),
-            self.translation_manager.get('status')
-        ])
+        self.products_table.setModel(self.product_model)
         
-        # Configure table
+        # Configure table. Fixed row heights and explicit column widths mean
+        # Qt never measures cell contents (ResizeToContents asks every row
+        # for a size hint on each load)
         header = self.products_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(5, QHeaderView.ResizeMode.ResizeToContents)
+        for column, width in ((1, 120), (2, 130), (3, 90), (4, 120), (5, 80)):
+            self.products_table.setColumnWidth(column, width)
         
-        self.products_table.setAlternatingRowColors(True)
-        self.products_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.products_table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
-        self.products_table.itemSelectionChanged.connect(self.on_product_selected)
+        vertical_header = self.products_table.verticalHeader()
+        vertical_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vertical_header.setDefaultSectionSize(28)
         
-        # Pagination controls
+        self.products_table.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.products_table.setAlternatingRowColors(True)
+        self.products_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.products_table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.products_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        
+        # Arrowing through rows changes the selection on every key repeat;
+        # the details panel is refreshed once the selection settles
+        self._selection_timer = QTimer(self)
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.setInterval(80)
+        self._selection_timer.timeout.connect(self.on_product_selected)
+        self.products_table.selectionModel().selectionChanged.connect(self.on_selection_changed)
+        
+        # Further rows are fetched as the table scrolls towards the end
+        self.product_model.fetch_more_requested.connect(self.fetch_more_products)
+        
+        # Loaded / total counter
         pagination_frame = QFrame()
         pagination_layout = QHBoxLayout()
         pagination_layout.setContentsMargins(0, 10, 0, 0)
         
-        self.prev_page_btn = QPushButton("◀ " + self.translation_manager.get('previous'))
-        self.prev_page_btn.setEnabled(False)
-        self.prev_page_btn.clicked.connect(self.on_prev_page)
-        
-        self.page_label = QLabel("Page 1 of 1")
+        self.loaded_label = QLabel("0 / 0")
         
-        self.next_page_btn = QPushButton(self.translation_manager.get('next') + " ▶")
-        self.next_page_btn.setEnabled(False)
-        self.next_page_btn.clicked.connect(self.on_next_page)
+        # Indeterminate bar shown while a product load is in flight
+        self.loading_bar = QProgressBar()
+        self.loading_bar.setRange(0, 0)
+        self.loading_bar.setTextVisible(False)
+        self.loading_bar.setMaximumWidth(120)
+        self.loading_bar.setVisible(False)
         
-        pagination_layout.addWidget(self.prev_page_btn)
+        pagination_layout.addWidget(self.loading_bar)
         pagination_layout.addStretch()
-        pagination_layout.addWidget(self.page_label)
-        pagination_layout.addStretch()
-        pagination_layout.addWidget(self.next_page_btn)
+        pagination_layout.addWidget(self.loaded_label)
         pagination_frame.setLayout(pagination_layout)
         
         table_layout.addWidget(self.products_table)
@@ -1052,23 +1761,23 @@ class ProductScreen(QWidget):
         self.details_frame.setObjectName("detailsFrame")
         self.details_frame.setVisible(False)
         
-        details_header = QLabel(self.translation_manager.get('product_details'))
-        details_header.setObjectName("detailsHeader")
+        self.details_header = QLabel(t('product_details'))
+        self.details_header.setObjectName("detailsHeader")
         
-        self.details_content = QLabel(self.translation_manager.get('select_product_to_view'))
+        self.details_content = QLabel(t('select_product_to_view'))
         self.details_content.setWordWrap(True)
         self.details_content.setAlignment(Qt.AlignmentFlag.AlignTop)
         
         details_buttons = QHBoxLayout()
-        self.edit_btn = QPushButton(self.translation_manager.get('edit'))
+        self.edit_btn = QPushButton(t('edit'))
         self.edit_btn.setObjectName("primary")
         self.edit_btn.clicked.connect(self.on_edit_product)
         
-        self.delete_btn = QPushButton(self.translation_manager.get('delete'))
+        self.delete_btn = QPushButton(t('delete'))
         self.delete_btn.setObjectName("danger")
         self.delete_btn.clicked.connect(self.on_delete_product)
         
-        self.view_variations_btn = QPushButton(self.translation_manager.get('variations'))
+        self.view_variations_btn = QPushButton(t('variations'))
         self.view_variations_btn.clicked.connect(self.on_view_variations)
         
         details_buttons.addWidget(self.edit_btn)
@@ -1077,7 +1786,7 @@ class ProductScreen(QWidget):
         details_buttons.addStretch()
         
         details_inner_layout = QVBoxLayout()
-        details_inner_layout.addWidget(details_header)
+        details_inner_layout.addWidget(self.details_header)
         details_inner_layout.addWidget(self.details_content, stretch=1)
         details_inner_layout.addLayout(details_buttons)
         self.details_frame.setLayout(details_inner_layout)
@@ -1101,9 +1810,9 @@ class ProductScreen(QWidget):
         
         self.setLayout(main_layout)
         
-        # Initialize pagination
-        self.current_page = 1
-        self.page_size = 20
+        # Products are fetched from the database page_size rows at a time
+        # (LIMIT/OFFSET in search_products) as the table is scrolled
+        self.page_size = 100
         self.total_products = 0
         
         # Set initial sizes
@@ -1111,13 +1820,18 @@ class ProductScreen(QWidget):
     
     def create_stats_frame(self):
         """Create statistics frame."""
-        stats_frame = QFrame()
+        t = self._tr
+        
+        # Counters are computed once the frame is first shown rather than
+        # during load_initial_data, so they never delay the first paint
+        stats_frame = StatsFrame()
         stats_frame.setObjectName("statsFrame")
+        stats_frame.first_shown.connect(lambda: QTimer.singleShot(0, self.update_stats))
         stats_layout = QVBoxLayout()
         stats_layout.setContentsMargins(15, 15, 15, 15)
         
-        stats_title = QLabel(self.translation_manager.get('quick_stats'))
-        stats_title.setObjectName("statsTitle")
+        self.stats_title = QLabel(t('quick_stats'))
+        self.stats_title.setObjectName("statsTitle")
         
         # Stats grid
         stats_grid = QGridLayout()
@@ -1126,220 +1840,433 @@ class ProductScreen(QWidget):
         # Total products
         self.total_products_label = QLabel("0")
         self.total_products_label.setObjectName("statValue")
-        stats_grid.addWidget(QLabel(self.translation_manager.get('total_products') + ":"), 0, 0)
+        stats_grid.addWidget(QLabel(t('total_products') + ":"), 0, 0)
         stats_grid.addWidget(self.total_products_label, 0, 1)
         
         # In stock
         self.in_stock_label = QLabel("0")
         self.in_stock_label.setObjectName("statValue")
-        stats_grid.addWidget(QLabel(self.translation_manager.get('in_stock') + ":"), 1, 0)
+        stats_grid.addWidget(QLabel(t('in_stock') + ":"), 1, 0)
         stats_grid.addWidget(self.in_stock_label, 1, 1)
         
         # Low stock
         self.low_stock_label = QLabel("0")
         self.low_stock_label.setObjectName("statValue")
-        stats_grid.addWidget(QLabel(self.translation_manager.get('low_stock') + ":"), 2, 0)
+        stats_grid.addWidget(QLabel(t('low_stock') + ":"), 2, 0)
         stats_grid.addWidget(self.low_stock_label, 2, 1)
         
         # Out of stock
         self.out_stock_label = QLabel("0")
         self.out_stock_label.setObjectName("statValue")
-        stats_grid.addWidget(QLabel(self.translation_manager.get('out_of_stock') + ":"), 3, 0)
+        stats_grid.addWidget(QLabel(t('out_of_stock') + ":"), 3, 0)
         stats_grid.addWidget(self.out_stock_label, 3, 1)
         
-        stats_layout.addWidget(stats_title)
+        stats_layout.addWidget(self.stats_title)
         stats_layout.addLayout(stats_grid)
         stats_layout.addStretch()
         
         # Refresh stats button
-        refresh_stats_btn = QPushButton(self.translation_manager.get('refresh_stats'))
-        refresh_stats_btn.clicked.connect(self.update_stats)
+        refresh_stats_btn = QPushButton(t('refresh_stats'))
+        refresh_stats_btn.clicked.connect(lambda: self.update_stats(force=True))
         stats_layout.addWidget(refresh_stats_btn)
         
         stats_frame.setLayout(stats_layout)
         return stats_frame
     
     def load_initial_data(self):
-        """Load initial data including categories and first page."""
+        """Load initial data including categories and first page.
+        
+        Stats are loaded separately when the stats frame is first shown.
+        """
         self.load_categories()
-        self.load_products_page()
-        self.update_stats()
+        self.load_products()
     
     def load_categories(self):
-        """Load categories into filter dropdown."""
-        try:
-            query = "SELECT id, name FROM categories WHERE is_active = 1 ORDER BY name"
-            categories = self.db_manager.execute_query(query)
-            
-            self.category_filter.clear()
-            self.category_filter.addItem(self.translation_manager.get('all_categories'), 0)
-            
-            for category in categories:
-                self.category_filter.addItem(category['name'], category['id'])
-        except Exception as e:
-            print(f"Error loading categories: {e}")
+        """Load categories into filter dropdown on the database pool."""
+        runner = QueryRunner(self._query_categories)
+        runner.signals.finished.connect(self._on_categories_loaded)
+        self.db_pool.start(runner)
     
-    def load_products_page(self):
-        """Load products for current page with filters."""
-        try:
-            # Get filters
-            search_text = self.search_input.text().strip()
-            category_id = self.category_filter.currentData()
-            stock_filter = self.stock_filter.currentData()
-            
-            # Map stock filter to controller parameters
-            in_stock_only = (stock_filter == 'in_stock')
-            
-            # Calculate offset
-            offset = (self.current_page - 1) * self.page_size
+    def _query_categories(self):
+        """Fetch active categories (runs on a pool thread)."""
+        query = "SELECT id, name FROM categories WHERE is_active = 1 ORDER BY name"
+        return self.db_manager.execute_query(query)
+    
+    def _on_categories_loaded(self, result):
+        """Fill the category filter, keeping the current selection."""
+        if not result['success']:
+            _warn_throttled('categories', "Error loading categories: %s", result['message'])
+            return
+        
+        selected_id = self.category_filter.currentData()
+        
+        # Build the items in a detached model and swap it in with one
+        # setModel, instead of one combo insert per category
+        model = QStandardItemModel(self.category_filter)
+        all_item = QStandardItem(self._tr('all_categories'))
+        all_item.setData(0, Qt.ItemDataRole.UserRole)
+        model.appendRow(all_item)
+        
+        for category in result['data']:
+            item = QStandardItem(category['name'])
+            item.setData(category['id'], Qt.ItemDataRole.UserRole)
+            model.appendRow(item)
+        
+        # Repopulating must not look like a filter change to on_filter_changed
+        self.category_filter.blockSignals(True)
+        self.category_filter.setModel(model)
+        
+        index = self.category_filter.findData(selected_id) if selected_id else -1
+        self.category_filter.setCurrentIndex(max(index, 0))
+        self.category_filter.blockSignals(False)
+    
+    def get_search_filters(self):
+        """Collect the current search text and filters as search_products arguments."""
+        category_id = self.category_filter.currentData()
+        stock_filter = self.stock_filter.currentData()
+        
+        return {
+            'query': self.search_input.text().strip(),
+            'category_id': category_id if category_id else None,
+            'stock_filter': stock_filter if stock_filter != 'all' else None
+        }
+    
+    def load_products(self):
+        """Start loading the first batch of products matching the filters."""
+        # This load already reads every filter, so a pending one is redundant
+        self._reload_timer.stop()
+        self._load_token += 1
+        self._pending_filters = self.get_search_filters()
+        self._last_query = self._pending_filters['query']
+        
+        if self._can_filter_locally(self._pending_filters):
+            self._filter_locally(self._pending_filters)
+            return
+        
+        cached = self._search_cache.get(self._search_cache_key(self._pending_filters))
+        if cached is not None:
+            self._on_products_loaded(self._load_token, cached)
+            return
+        
+        loader = ProductLoader(
+            self.product_controller,
+            self._load_token,
+            dict(self._pending_filters, limit=self.page_size, offset=0)
+        )
+        loader.signals.results.connect(self._on_products_loaded)
+        self.loading_bar.setVisible(True)
+        self.db_pool.start(loader)
+    
+    def _on_products_loaded(self, token, result):
+        """Show the first batch of products once the loader finishes."""
+        if token != self._load_token:
+            return  # A newer load has been started
+        
+        self.loading_bar.setVisible(False)
+        
+        if result['success']:
+            self._active_filters = self._pending_filters
+            self._cache_search_result(result)
+            self._set_search_base(result)
+            self.total_products = result['total_count']
+            self.display_products(result['products'], result['has_more'])
             
-            # Search products
-            result = self.product_controller.search_products(
-                query=search_text,
-                category_id=category_id if category_id else None,
-                in_stock_only=in_stock_only,
-                limit=self.page_size,
-                offset=offset
-            )
+            if self._select_after_load is not None:
+                self.select_product_by_id(self._select_after_load)
+                self._select_after_load = None
+        else:
+            QMessageBox.warning(self, "Error", f"Failed to load products: {result['message']}")
+    
+    def _set_search_base(self, result):
+        """Keep a complete result set (and its search index) for local filtering."""
+        if result['has_more']:
+            self._search_index = None
+            return
+        
+        self._base_products = result['products']
+        self._base_filters = self._active_filters
+        self._search_index = [
+            ' '.join(str(product.get(field) or '') for field in (
+                'name', 'sku', 'barcode', 'brand', 'description', 'variation_codes'
+            )).lower().replace('\n', ' ')
+            for product in self._base_products
+        ]
+        
+        # One buffer so the first word is located with str.find in C
+        # instead of a Python-level test per row
+        self._search_buffer = '\n'.join(self._search_index)
+        self._search_offsets = []
+        position = 0
+        for haystack in self._search_index:
+            self._search_offsets.append(position)
+            position += len(haystack) + 1
+    
+    def _can_filter_locally(self, filters):
+        """
+        Whether filtering the loaded base rows gives what search_products would.
+        
+        search_products keeps rows where every word is a case-insensitive
+        substring of one of the haystack fields, so a query that extends the
+        base query matches a subset of the base rows, found by the same test
+        locally. Words shorter than FTS_MIN_TERM_LENGTH go through SQLite
+        LIKE, which folds only ASCII case; queries with such a word that is
+        not ASCII are sent to the database.
+        """
+        base = self._base_filters
+        query = filters['query']
+        return (
+            self._search_index is not None
+            and filters['category_id'] == base['category_id']
+            and filters['stock_filter'] == base['stock_filter']
+            and query.lower().startswith(base['query'].lower())
+            and all(word.isascii() or len(word) >= FTS_MIN_TERM_LENGTH for word in query.split())
+        )
+    
+    def _filter_locally(self, filters):
+        """Show the base rows whose haystack contains every search word."""
+        query = filters['query'].lower()
+        words = query.split()
+        
+        if not words:
+            products = list(self._base_products)
+        else:
+            first_word, other_words = words[0], words[1:]
+            buffer = self._search_buffer
+            offsets = self._search_offsets
+            products = []
             
-            if result['success']:
-                self.display_products(result['products'])
-                self.total_products = result['total_count']
-                self.update_pagination_controls()
-            else:
-                QMessageBox.warning(self, "Error", result['message'])
+            position = buffer.find(first_word)
+            while position != -1:
+                row = bisect_right(offsets, position) - 1
+                haystack = self._search_index[row]
+                if all(word in haystack for word in other_words):
+                    products.append(self._base_products[row])
                 
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to load products: {str(e)}")
+                # Continue from the start of the next row
+                position = buffer.find(first_word, offsets[row] + len(haystack) + 1)
+            
+            # Same order as search_products: names starting with the query
+            # first, then by name
+            products.sort(key=lambda product: (not product['name'].lower().startswith(query),
+                                               product['name']))
+        
+        self._active_filters = filters
+        self.total_products = len(products)
+        self.loading_bar.setVisible(False)
+        self.display_products(products, False)
+    
+    def _search_cache_key(self, filters):
+        """Return the prefix cache key for a set of filters, or None if not cacheable."""
+        query = filters['query']
+        if not query or len(query) > SHORT_QUERY_LENGTH:
+            return None
+        return (query.lower(), filters['category_id'], filters['stock_filter'])
+    
+    def _cache_search_result(self, result):
+        """Remember the first batch of a short search."""
+        key = self._search_cache_key(self._active_filters)
+        if key is None:
+            return
+        
+        self._search_cache[key] = result
+        self._search_cache.move_to_end(key)
+        if len(self._search_cache) > SEARCH_CACHE_SIZE:
+            self._search_cache.popitem(last=False)
+    
+    def fetch_more_products(self, offset):
+        """Start loading the next batch of products when the table scrolls near the end."""
+        # Continue the search whose rows are displayed, even if the filter
+        # widgets have changed since. The batch carries the current load
+        # token, so it is dropped if a new search replaces the rows first
+        loader = ProductLoader(
+            self.product_controller,
+            self._load_token,
+            dict(self._active_filters, limit=self.page_size, offset=offset, with_total=False)
+        )
+        loader.signals.results.connect(self._on_more_products_loaded)
+        self.db_pool.start(loader)
+    
+    def _on_more_products_loaded(self, token, result):
+        """Append a batch fetched by fetch_more_products."""
+        if token != self._load_token:
+            return  # The rows this batch continues have been replaced
+        
+        if result['success']:
+            self.product_model.append_products(result['products'], result['has_more'])
+        else:
+            # Stop fetching; the next load_products starts over
+            self.product_model.append_products([], False)
+            _warn_throttled('fetch_more', "Error fetching more products: %s", result['message'])
+        
+        self.update_loaded_label()
     
-    def display_products(self, products):
+    def display_products(self, products, has_more=False):
         """Display products in the table."""
-        self.products_table.setRowCount(len(products))
+        self.product_model.set_products(products, has_more)
+        self.update_loaded_label()
+    
+    def update_loaded_label(self):
+        """Show how many of the matching products are loaded."""
+        self.loaded_label.setText(f"{self.product_model.rowCount()} / {self.total_products}")
+    
+    def update_stats(self, force=False):
+        """
+        Update statistics display.
         
-        for row, product in enumerate(products):
-            # Product name
-            name_item = QTableWidgetItem(product['name'])
-            name_item.setData(Qt.ItemDataRole.UserRole, product['id'])
-            self.products_table.setItem(row, 0, name_item)
-            
-            # SKU
-            sku_item = QTableWidgetItem(product['sku'] or "")
-            self.products_table.setItem(row, 1, sku_item)
-            
-            # Price
-            price_item = QTableWidgetItem(product.get('display_price', 'N/A'))
-            self.products_table.setItem(row, 2, price_item)
-            
-            # Stock quantity
-            stock_qty = product.get('total_stock', 0)
-            stock_item = QTableWidgetItem(str(stock_qty))
-            
-            # Color code based on stock level
-            if stock_qty <= product.get('low_stock_threshold', 5):
-                stock_item.setForeground(QColor('#f39c12'))  # Orange for low stock
-            elif stock_qty == 0:
-                stock_item.setForeground(QColor('#e74c3c'))  # Red for out of stock
-            else:
-                stock_item.setForeground(QColor('#27ae60'))  # Green for in stock
-            
-            self.products_table.setItem(row, 3, stock_item)
-            
-            # Category
-            category_item = QTableWidgetItem(product['category'] or "")
-            self.products_table.setItem(row, 4, category_item)
-            
-            # Status
-            status_text = self.translation_manager.get('active') if product['is_active'] else self.translation_manager.get('inactive')
-            status_item = QTableWidgetItem(status_text)
-            status_item.setForeground(QColor('#27ae60') if product['is_active'] else QColor('#7f8c8d'))
-            self.products_table.setItem(row, 5, status_item)
-    
-    def update_pagination_controls(self):
-        """Update pagination controls based on current page and total products."""
-        total_pages = max(1, (self.total_products + self.page_size - 1) // self.page_size)
-        
-        self.page_label.setText(f"Page {self.current_page} of {total_pages}")
-        self.prev_page_btn.setEnabled(self.current_page > 1)
-        self.next_page_btn.setEnabled(self.current_page < total_pages)
-    
-    def update_stats(self):
-        """Update statistics display."""
-        try:
-            # Total products
-            total_query = "SELECT COUNT(*) as count FROM products WHERE is_active = 1"
-            total_result = self.db_manager.execute_query(total_query)
-            total_count = total_result[0]['count'] if total_result else 0
-            self.total_products_label.setText(str(total_count))
-            
-            # In stock - FIXED QUERY
-            in_stock_query = """
-            SELECT COUNT(DISTINCT p.id) as count 
-            FROM products p
-            WHERE p.is_active = 1 
-            AND (
-                p.stock_quantity > 0 
-                OR EXISTS (
-                    SELECT 1 FROM product_variations pv 
-                    WHERE pv.product_id = p.id 
-                    AND pv.is_active = 1 
-                    AND pv.stock_quantity > 0
-                )
-            )
-            """
-            in_stock_result = self.db_manager.execute_query(in_stock_query)
-            in_stock_count = in_stock_result[0]['count'] if in_stock_result else 0
-            self.in_stock_label.setText(str(in_stock_count))
-            
-            # Low stock (using default threshold of 5)
-            low_stock_result = self.product_controller.get_low_stock_products(threshold=5)
-            low_stock_count = len(low_stock_result['products']) if low_stock_result['success'] else 0
-            self.low_stock_label.setText(str(low_stock_count))
-            
-            # Out of stock - FIXED QUERY
-            out_stock_query = """
-            SELECT COUNT(DISTINCT p.id) as count 
-            FROM products p
-            WHERE p.is_active = 1 
-            AND p.stock_quantity = 0
-            AND NOT EXISTS (
-                SELECT 1 FROM product_variations pv 
-                WHERE pv.product_id = p.id 
-                AND pv.is_active = 1 
-                AND pv.stock_quantity > 0
-            )
-            """
-            out_stock_result = self.db_manager.execute_query(out_stock_query)
-            out_stock_count = out_stock_result[0]['count'] if out_stock_result else 0
-            self.out_stock_label.setText(str(out_stock_count))
-            
-        except Exception as e:
-            print(f"Error updating stats: {e}")
+        The counters are computed on the database pool and reused for
+        STATS_CACHE_TTL seconds unless a product was added, edited or
+        deleted here since they were computed.
+        
+        Args:
+            force: Recompute even if the cached counters are still fresh
+        """
+        if (not force and not self._stats_dirty and self._stats_cache is not None and
+                time.monotonic() - self._stats_cache_ts < STATS_CACHE_TTL):
+            return
+        
+        if self._stats_loading:
+            # Counters in flight may predate the change; run again after them
+            self._stats_reload = True
+            return
+        
+        self._stats_loading = True
+        self._stats_reload = False
+        runner = QueryRunner(self._query_stats)
+        runner.signals.finished.connect(self._on_stats_loaded)
+        self.db_pool.start(runner)
+    
+    def _query_stats(self):
+        """
+        Count active products by stock state (runs on a pool thread).
+        
+        Returns:
+            (total, in stock, low stock, out of stock) counts
+        """
+        # No threshold override: each product's own thresholds apply
+        result = self.db_manager.execute_query(PRODUCT_STATS_QUERY, (None, None))
+        stats = result[0] if result else {}
+        
+        return (
+            stats.get('total_count') or 0,
+            stats.get('in_stock_count') or 0,
+            stats.get('low_stock_count') or 0,
+            stats.get('out_stock_count') or 0
+        )
+    
+    def _on_stats_loaded(self, result):
+        """Cache and display counters computed by _query_stats."""
+        self._stats_loading = False
+        
+        if self._stats_reload:
+            self.update_stats(force=True)
+            return
+        
+        if not result['success']:
+            _warn_throttled('stats', "Error updating stats: %s", result['message'])
+            return
+        
+        self._stats_cache = result['data']
+        self._stats_cache_ts = time.monotonic()
+        self._stats_dirty = False
+        
+        total_count, in_stock_count, low_stock_count, out_stock_count = self._stats_cache
+        self.total_products_label.setText(str(total_count))
+        self.in_stock_label.setText(str(in_stock_count))
+        self.low_stock_label.setText(str(low_stock_count))
+        self.out_stock_label.setText(str(out_stock_count))
+    
+    def on_search_text_changed(self):
+        """Restart the search debounce timer on every keystroke."""
+        self.search_timer.start()
     
     def on_search(self):
         """Handle search action."""
-        self.current_page = 1
-        self.load_products_page()
+        self.search_timer.stop()
+        if self.search_input.text().strip() == self._last_query:
+            return  # Already showing results for this text
+        self.load_products()
     
     def on_filter_changed(self):
         """Handle filter changes."""
-        self.current_page = 1
-        self.load_products_page()
-    
-    def on_prev_page(self):
-        """Go to previous page."""
-        if self.current_page > 1:
-            self.current_page -= 1
-            self.load_products_page()
-    
-    def on_next_page(self):
-        """Go to next page."""
-        self.current_page += 1
-        self.load_products_page()
+        self._reload_timer.start()
     
     def on_refresh(self):
         """Refresh all data."""
-        self.current_page = 1
-        self.load_products_page()
+        # Also runs after products are added, and after edits or deletes
+        # that cannot be applied to a single row
+        self._drop_cached_results()
+        self.load_products()
+        self.update_stats()
+        self.refresh_requested.emit()
+    
+    def _drop_cached_results(self):
+        """Forget cached search results after products change."""
+        self._search_cache.clear()
+        self._search_index = None
+    
+    def refresh_product_row(self, product_id):
+        """
+        Update an edited product's row in place instead of reloading the table.
+        
+        The row is re-read on the database pool under the current load token
+        and applied by _on_product_row_loaded. Falls back to on_refresh when
+        the product is not loaded or no filters are active.
+        
+        Args:
+            product_id: ID of the edited product
+        """
+        if self.product_model.find_row(product_id) < 0 or self._active_filters is None:
+            self.on_refresh()
+            return
+        
+        # Cached pages hold the old row; drop them before any load can use them
+        self._drop_cached_results()
+        self.update_stats()
+        self.refresh_requested.emit()
+        
+        loader = ProductLoader(
+            self.product_controller,
+            self._load_token,
+            dict(self._active_filters, product_id=product_id, limit=1, with_total=False)
+        )
+        loader.signals.results.connect(self._on_product_row_loaded)
+        self.db_pool.start(loader)
+    
+    def _on_product_row_loaded(self, token, result):
+        """
+        Apply a row fetched by refresh_product_row.
+        
+        Reloads the table instead when the product no longer matches the
+        active filters or was renamed (rows are sorted by name).
+        """
+        if token != self._load_token:
+            return  # A newer load replaced the rows and reads the edit itself
+        
+        products = result['products'] if result['success'] else []
+        row = self.product_model.find_row(products[0]['id']) if products else -1
+        if row < 0 or products[0]['name'] != self.product_model.product_name(row):
+            self.on_refresh()
+            return
+        
+        self.product_model.update_row(row, products[0])
+    
+    def remove_product_row(self, product_id):
+        """
+        Remove a deleted product's row instead of reloading the table.
+        
+        Args:
+            product_id: ID of the deleted product
+        """
+        row = self.product_model.find_row(product_id)
+        if row < 0:
+            self.on_refresh()
+            return
+        
+        self.product_model.remove_row(row)
+        if self.total_products:
+            self.total_products -= 1
+        self.update_loaded_label()
+        self._drop_cached_results()
         self.update_stats()
         self.refresh_requested.emit()
     
@@ -1366,25 +2293,24 @@ class ProductScreen(QWidget):
             
             if controller_result['success']:
                 QMessageBox.information(self, 
-                    self.translation_manager.get('success'),
-                    self.translation_manager.get('product_created_successfully')
+                    self._tr('success'),
+                    self._tr('product_created_successfully')
                 )
                 
-                # Refresh the list
-                self.on_refresh()
-                
-                # Select the new product
-                self.select_product_by_id(controller_result['product_id'])
+                # Refresh the list on the next event loop pass and select
+                # the new product once it arrives
+                self._select_after_load = controller_result['product_id']
+                self._stats_dirty = True
+                QTimer.singleShot(0, self.on_refresh)
             else:
                 QMessageBox.critical(self, 
-                    self.translation_manager.get('error'),
+                    self._tr('error'),
                     controller_result['message']
                 )
     def select_product_by_id(self, product_id):
         """Select a product in the table by ID."""
-        for row in range(self.products_table.rowCount()):
-            item = self.products_table.item(row, 0)
-            if item and item.data(Qt.ItemDataRole.UserRole) == product_id:
+        for row in range(self.product_model.rowCount()):
+            if self.product_model.product_id(row) == product_id:
                 self.products_table.selectRow(row)
                 self.on_product_selected()
                 return True
@@ -1392,23 +2318,38 @@ class ProductScreen(QWidget):
     
     def on_edit_product(self):
         """Edit selected product."""
+        t = self._tr
+        
         if not self.current_product_id:
             QMessageBox.warning(self, 
-                self.translation_manager.get('warning'),
-                self.translation_manager.get('please_select_product_first')
+                t('warning'),
+                t('please_select_product_first')
             )
             return
         
-        # Get current product data
-        result = self.product_controller.get_full_product(self.current_product_id)
-        if not result['success']:
-            QMessageBox.critical(self, 
-                self.translation_manager.get('error'),
-                result['message']
+        # Reuse the row the details panel loaded if the product has not been
+        # written since (a sale or another screen may have changed it, and
+        # saving the form writes every field back); otherwise fetch it again
+        product_data = self._details_product
+        if product_data is not None and product_data.get('id') == self.current_product_id:
+            rows = self.db_manager.execute_query_tuples(
+                PRODUCT_UPDATED_AT_QUERY, (self.current_product_id,)
             )
-            return
+            if not rows or rows[0][0] != product_data.get('updated_at'):
+                product_data = None
+        else:
+            product_data = None
         
-        product_data = result['product']
+        if product_data is None:
+            result = self.product_controller.get_full_product(self.current_product_id)
+            if not result['success']:
+                QMessageBox.critical(self, 
+                    t('error'),
+                    result['message']
+                )
+                return
+            
+            product_data = result['product']
         
         # Create dialog with existing data
         dialog = ProductFormDialog(
@@ -1434,40 +2375,50 @@ class ProductScreen(QWidget):
             
             if controller_result['success']:
                 QMessageBox.information(self, 
-                    self.translation_manager.get('success'),
-                    self.translation_manager.get('product_updated_successfully')
+                    t('success'),
+                    t('product_updated_successfully')
                 )
                 
-                # Refresh the list and details
-                self.load_product_details(self.current_product_id)
-                self.on_refresh()
+                # Refresh the details now and the product's row on the next
+                # event loop pass
+                product_id = self.current_product_id
+                self.load_product_details(product_id)
+                self._stats_dirty = True
+                QTimer.singleShot(0, lambda: self.refresh_product_row(product_id))
             else:
                 QMessageBox.critical(self, 
-                    self.translation_manager.get('error'),
+                    t('error'),
                     controller_result['message']
                 )
     
     def on_delete_product(self):
         """Delete selected product."""
+        t = self._tr
+        
         if not self.current_product_id:
             QMessageBox.warning(self, 
-                self.translation_manager.get('warning'),
-                self.translation_manager.get('please_select_product_first')
+                t('warning'),
+                t('please_select_product_first')
             )
             return
         
-        # Get product name for confirmation
-        query = "SELECT name FROM products WHERE id = ?"
-        result = self.db_manager.execute_query(query, (self.current_product_id,))
-        product_name = result[0]['name'] if result else f"Product #{self.current_product_id}"
+        # Get product name for confirmation, from the details panel's row
+        # when it is for this product
+        details = self._details_product
+        if details is not None and details.get('id') == self.current_product_id:
+            product_name = details.get('name') or f"Product #{self.current_product_id}"
+        else:
+            query = "SELECT name FROM products WHERE id = ?"
+            result = self.db_manager.execute_query(query, (self.current_product_id,))
+            product_name = result[0]['name'] if result else f"Product #{self.current_product_id}"
         
         reply = QMessageBox.question(
             self,
-            self.translation_manager.get('confirm_delete'),
-            f"{self.translation_manager.get('are_you_sure_delete_product')}\n\n" +
+            t('confirm_delete'),
+            f"{t('are_you_sure_delete_product')}\n\n" +
             f"ID: {self.current_product_id}\n" +
-            f"{self.translation_manager.get('name')}: {product_name}\n\n" +
-            self.translation_manager.get('this_action_cannot_be_undone'),
+            f"{t('name')}: {product_name}\n\n" +
+            t('this_action_cannot_be_undone'),
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
             QMessageBox.StandardButton.No
         )
@@ -1485,51 +2436,59 @@ class ProductScreen(QWidget):
                 
                 if controller_result['success']:
                     QMessageBox.information(self, 
-                        self.translation_manager.get('success'),
-                        self.translation_manager.get('product_deleted_successfully')
+                        t('success'),
+                        t('product_deleted_successfully')
                     )
                     
-                    # Refresh and clear details
-                    self.on_refresh()
+                    # Clear details now and drop the row on the next event
+                    # loop pass
+                    product_id = self.current_product_id
+                    self._stats_dirty = True
                     self.clear_product_details()
+                    QTimer.singleShot(0, lambda: self.remove_product_row(product_id))
                 else:
                     QMessageBox.critical(self, 
-                        self.translation_manager.get('error'),
+                        t('error'),
                         controller_result['message']
                     )
                     
             except Exception as e:
                 QMessageBox.critical(self, 
-                    self.translation_manager.get('error'),
-                    f"{self.translation_manager.get('failed_to_delete_product')}: {str(e)}"
+                    t('error'),
+                    f"{t('failed_to_delete_product')}: {str(e)}"
                 )
     
     def on_view_variations(self):
         """View variations for selected product."""
         if not self.current_product_id:
             QMessageBox.warning(self, 
-                self.translation_manager.get('warning'),
-                self.translation_manager.get('please_select_product_first')
+                self._tr('warning'),
+                self._tr('please_select_product_first')
             )
             return
         
-        # Create and show variations dialog
-        dialog = VariationsViewDialog(
-            product_controller=self.product_controller,
-            product_id=self.current_product_id,
-            translation_manager=self.translation_manager,
-            parent=self
-        )
+        # The dialog is built on first use and then only reloaded
+        if self._variations_dialog is None:
+            self._variations_dialog = VariationsViewDialog(
+                product_controller=self.product_controller,
+                product_id=self.current_product_id,
+                translation_manager=self.translation_manager,
+                parent=self
+            )
+        else:
+            self._variations_dialog.set_product_id(self.current_product_id)
         
-        dialog.exec()
+        self._variations_dialog.exec()
     
     def on_export(self):
         """Export products data."""
+        t = self._tr
+        
         try:
             # Ask for file location
             file_path, _ = QFileDialog.getSaveFileName(
                 self,
-                self.translation_manager.get('export_products'),
+                t('export_products'),
                 "",
                 "CSV Files (*.csv);;All Files (*)"
             )
@@ -1544,8 +2503,8 @@ class ProductScreen(QWidget):
             # Ask for export scope
             scope_reply = QMessageBox.question(
                 self,
-                self.translation_manager.get('export_scope'),
-                self.translation_manager.get('export_all_or_selected'),
+                t('export_scope'),
+                t('export_all_or_selected'),
                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No | QMessageBox.StandardButton.Cancel,
                 QMessageBox.StandardButton.Yes
             )
@@ -1560,54 +2519,84 @@ class ProductScreen(QWidget):
                     product_ids = [self.current_product_id]
                 else:
                     QMessageBox.warning(self, 
-                        self.translation_manager.get('warning'),
-                        self.translation_manager.get('please_select_product_first_for_export')
+                        t('warning'),
+                        t('please_select_product_first_for_export')
                     )
                     return
             
-            # Show progress
-            progress = QMessageBox(self)
-            progress.setWindowTitle(self.translation_manager.get('exporting'))
-            progress.setText(self.translation_manager.get('exporting_products_please_wait'))
-            progress.setStandardButtons(QMessageBox.StandardButton.NoButton)
-            progress.show()
-            
-            # Use controller to export
-            result = self.product_controller.export_products_csv(file_path, product_ids)
+            # Show progress while the export runs on the I/O pool. The row
+            # count is known for a selection, or from the stats counters for
+            # a full export; without it the dialog shows a busy indicator
+            if product_ids:
+                expected_rows = len(product_ids)
+            elif self._stats_cache is not None:
+                expected_rows = self._stats_cache[0]
+            else:
+                expected_rows = 0
             
-            progress.close()
+            self._export_progress = QProgressDialog(
+                t('exporting_products_please_wait'), "", 0, expected_rows, self
+            )
+            self._export_progress.setWindowTitle(t('exporting'))
+            self._export_progress.setCancelButton(None)
+            self._export_progress.setAutoClose(False)
+            self._export_progress.setAutoReset(False)
+            self._export_progress.setMinimumDuration(0)
+            self._export_progress.show()
+            self.export_btn.setEnabled(False)
             
-            if result['success']:
-                QMessageBox.information(self, 
-                    self.translation_manager.get('success'),
-                    f"{result['message']}\n\n" +
-                    f"{self.translation_manager.get('file_saved_to')}: {file_path}"
-                )
-                
-                # Log success
-                print(f"Exported {result['exported_count']} products to {file_path}")
-            else:
-                QMessageBox.critical(self, 
-                    self.translation_manager.get('error'),
-                    result['message']
-                )
+            exporter = ProductExporter(self.product_controller, file_path, product_ids)
+            exporter.signals.progress.connect(self._on_export_progress)
+            exporter.signals.finished.connect(self._on_export_finished)
+            self.io_pool.start(exporter)
                 
         except Exception as e:
             QMessageBox.critical(self, 
-                self.translation_manager.get('error'),
-                f"{self.translation_manager.get('export_failed')}: {str(e)}"
+                t('error'),
+                f"{t('export_failed')}: {str(e)}"
+            )
+    
+    def _on_export_progress(self, exported_count):
+        """Advance the export progress dialog."""
+        progress = self._export_progress
+        if progress is not None and progress.maximum():
+            progress.setValue(min(exported_count, progress.maximum()))
+    
+    def _on_export_finished(self, file_path, result):
+        """Report the outcome of a background export."""
+        if self._export_progress is not None:
+            self._export_progress.close()
+            self._export_progress = None
+        self.export_btn.setEnabled(True)
+        
+        if result['success']:
+            QMessageBox.information(self, 
+                self._tr('success'),
+                f"{result['message']}\n\n" +
+                f"{self._tr('file_saved_to')}: {file_path}"
+            )
+            
+            # Log success
+            logger.info("Exported %s products to %s", result['exported_count'], file_path)
+        else:
+            QMessageBox.critical(self, 
+                self._tr('error'),
+                result['message']
             )
     
+    def on_selection_changed(self):
+        """Restart the selection timer; details load when it fires."""
+        self._selection_timer.start()
+    
     def on_product_selected(self):
         """Handle product selection from table."""
-        selected_items = self.products_table.selectedItems()
-        if not selected_items:
+        self._selection_timer.stop()
+        selected_rows = self.products_table.selectionModel().selectedRows()
+        if not selected_rows:
             self.clear_product_details()
             return
         
-        row = selected_items[0].row()
-        product_id_item = self.products_table.item(row, 0)
-        product_id = product_id_item.data(Qt.ItemDataRole.UserRole)
+        product_id = self.product_model.product_id(selected_rows[0].row())
         
         self.current_product_id = product_id
         self.load_product_details(product_id)
@@ -1619,32 +2608,17 @@ class ProductScreen(QWidget):
         if result['success']:
             product = result['product']
             variations = result['variations']
+            self._details_product = product
             
-            # Prepare safe display values
-            cost_display = f"${product['cost_price']:.2f}" if product.get('cost_price') else 'N/A'
-            sku_display = product.get('sku', 'N/A')
-            category_display = product.get('category', 'N/A')
-            brand_display = product.get('brand', 'N/A')
-            
-            details_html = f"""
-            <div style="font-family: 'Segoe UI', Arial, sans-serif;">
-                <h2 style="color: #e74c3c; margin-bottom: 10px;">{product.get('name', 'N/A')}</h2>
-                <p><strong>ID:</strong> {product.get('id', 'N/A')}</p>
-                <p><strong>SKU:</strong> {sku_display}</p>
-                <p><strong>Type:</strong> {product.get('type', 'N/A')}</p>
-                <p><strong>Category:</strong> {category_display}</p>
-                <p><strong>Brand:</strong> {brand_display}</p>
-                <p><strong>Price:</strong> ${product.get('price', 0.00):.2f}</p>
-                <p><strong>Cost:</strong> {cost_display}</p>
-                <p><strong>Stock:</strong> {product.get('stock_quantity', 0)} ({product.get('stock_status', 'N/A')})</p>
-                <p><strong>Variations:</strong> {len(variations)}</p>
-                <p><strong>Created:</strong> {product.get('created_at', 'N/A')}</p>
-                <p><strong>Updated:</strong> {product.get('updated_at', 'N/A')}</p>
-            </div>
-            """
-            
-            if product.get('description'):
-                details_html += f"<p><strong>Description:</strong><br>{product['description']}</p>"
+            # Re-selecting an unchanged product reuses its rendered HTML
+            cache_key = (*map(product.get, DETAILS_KEY_FIELDS), len(variations))
+            details_html = self._details_html_cache.get(cache_key)
+            if details_html is None:
+                details_html = self._render_product_details(product, variations)
+                self._details_html_cache[cache_key] = details_html
+                if len(self._details_html_cache) > DETAILS_HTML_CACHE_SIZE:
+                    self._details_html_cache.popitem(last=False)
+            self._details_html_cache.move_to_end(cache_key)
             
             self.details_content.setText(details_html)
             self.details_frame.setVisible(True)
@@ -1655,6 +2629,7 @@ class ProductScreen(QWidget):
             self.view_variations_btn.setEnabled(len(variations) > 0)
             
         else:
+            self._details_product = None
             self.details_content.setText(f"<p style='color: #e74c3c;'>{result['message']}</p>")
             self.details_frame.setVisible(True)
             
@@ -1663,66 +2638,91 @@ class ProductScreen(QWidget):
             self.delete_btn.setEnabled(False)
             self.view_variations_btn.setEnabled(False)
     
+    def _render_product_details(self, product, variations):
+        """Build the details panel HTML, with text fields escaped."""
+        # One merged dict: PRODUCT_DETAILS_DEFAULTS for missing or NULL
+        # columns, the product row with its text escaped, and the computed
+        # display values
+        fields = {
+            **PRODUCT_DETAILS_DEFAULTS,
+            **{key: html.escape(value) if isinstance(value, str) else value
+               for key, value in product.items() if value is not None}
+        }
+        fields['cost_display'] = f"${product['cost_price']:.2f}" if product.get('cost_price') else 'N/A'
+        fields['category_display'] = fields.get('category_name') or fields.get('category') or 'N/A'
+        fields['variation_count'] = len(variations)
+        
+        details_html = PRODUCT_DETAILS_HTML.format_map(fields)
+        
+        if product.get('description'):
+            details_html += f"<p><strong>Description:</strong><br>{html.escape(str(product['description']))}</p>"
+        
+        return details_html
+    
+    def clear_product_details(self):
+        """Hide the details panel when no product is selected."""
+        self.current_product_id = None
+        self._details_product = None
+        self.details_content.setText(self._tr('select_product_to_view'))
+        self.details_frame.setVisible(False)
+    
     def update_language(self):
         """Update UI text when language changes."""
+        t = self.translation_manager.get_many(self.LANGUAGE_KEYS)
+        
         self.current_language = self.translation_manager.get_current_lang()
         
-        # Update static text
-        title_label = self.findChild(QLabel, "pageTitle")
-        if title_label:
-            title_label.setText(self.translation_manager.get('products'))
-        
-        # Update buttons
-        self.new_product_btn.setText(f"➕ {self.translation_manager.get('add_new')}")
-        self.refresh_btn.setText(f"🔄 {self.translation_manager.get('refresh')}")
-        self.export_btn.setText(f"📤 {self.translation_manager.get('export')}")
-        
-        # Update search
-        self.search_input.setPlaceholderText(self.translation_manager.get('search_products'))
-        
-        search_btn = self.findChild(QPushButton)
-        if search_btn and search_btn.objectName() != "new_product_btn":
-            search_btn.setText(self.translation_manager.get('search'))
-        
-        # Update table headers
-        headers = [
-            self.translation_manager.get('product_name'),
-            self.translation_manager.get('sku'),
-            self.translation_manager.get('price'),
-            self.translation_manager.get('stock_quantity'),
-            self.translation_manager.get('category'),
-            self.translation_manager.get('status')
-        ]
-        for col, header in enumerate(headers):
-            self.products_table.horizontalHeaderItem(col).setText(header)
-        
-        # Update pagination
-        self.prev_page_btn.setText("◀ " + self.translation_manager.get('previous'))
-        self.next_page_btn.setText(self.translation_manager.get('next') + " ▶")
-        
-        # Update details
-        details_header = self.findChild(QLabel, "detailsHeader")
-        if details_header:
-            details_header.setText(self.translation_manager.get('product_details'))
-        
-        self.edit_btn.setText(self.translation_manager.get('edit'))
-        self.delete_btn.setText(self.translation_manager.get('delete'))
-        self.view_variations_btn.setText(self.translation_manager.get('variations'))
-        
-        # Update stats
-        stats_title = self.findChild(QLabel, "statsTitle")
-        if stats_title:
-            stats_title.setText(self.translation_manager.get('quick_stats'))
-        
-        # Update filter dropdowns
-        self.category_filter.setItemText(0, self.translation_manager.get('all_categories'))
-        
-        self.stock_filter.blockSignals(True)
-        self.stock_filter.setItemText(0, self.translation_manager.get('all_stock'))
-        self.stock_filter.setItemText(1, self.translation_manager.get('in_stock'))
-        self.stock_filter.setItemText(2, self.translation_manager.get('low_stock'))
-        self.stock_filter.setItemText(3, self.translation_manager.get('out_of_stock'))
-        self.stock_filter.blockSignals(False)
+        # Strings cached by _tr belong to the previous language
+        self._tr_lang_version += 1
+        self._tr_cache.clear()
+        
+        # Retitle every widget before Qt lays out and repaints the screen
+        self.setUpdatesEnabled(False)
+        try:
+            # Update static text
+            self.title_label.setText(t['products'])
+            
+            # Update buttons
+            self.new_product_btn.setText(t['add_new'])
+            self.refresh_btn.setText(t['refresh'])
+            self.export_btn.setText(t['export'])
+            
+            # Update search
+            self.search_input.setPlaceholderText(t['search_products'])
+            
+            self.search_btn.setText(t['search'])
+            
+            # Update table headers
+            self.product_model.retranslate()
+            
+            # Update details
+            self.details_header.setText(t['product_details'])
+            
+            self.edit_btn.setText(t['edit'])
+            self.delete_btn.setText(t['delete'])
+            self.view_variations_btn.setText(t['variations'])
+            
+            # Update stats
+            self.stats_title.setText(t['quick_stats'])
+            
+            # Update filter dropdowns
+            self.category_filter.blockSignals(True)
+            self.category_filter.setItemText(0, t['all_categories'])
+            self.category_filter.blockSignals(False)
+            
+            self.stock_filter.blockSignals(True)
+            self.stock_filter.setItemText(0, t['all_stock'])
+            self.stock_filter.setItemText(1, t['in_stock'])
+            self.stock_filter.setItemText(2, t['low_stock'])
+            self.stock_filter.setItemText(3, t['out_of_stock'])
+            self.stock_filter.blockSignals(False)
+        finally:
+            self.setUpdatesEnabled(True)
+        
+        # The variations dialog was labelled in the old language
+        if self._variations_dialog is not None:
+            self._variations_dialog.deleteLater()
+            self._variations_dialog = None
         
         # Refresh data
         self.on_refresh()
@@ -0,0 +1,70 @@
+"""
+Tests for ProductController against a temporary database.
+"""
+
+import os
+import tempfile
+import unittest
+
+from database import DatabaseManager
+from product_controller import ProductController
+
+
+class BulkUpdateStockTest(unittest.TestCase):
+    """bulk_update_stock writes movements and stock for a whole batch."""
+    
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db = DatabaseManager(os.path.join(self.tmp_dir.name, 'test.db'))
+        self.controller = ProductController(self.db)
+        
+        result = self.controller.create_product(
+            {'name': 'Shirt', 'type': 'variable', 'price': 10.0, 'sku': 'SH-1', 'created_by': 1},
+            [{'name': 'Small', 'sku': 'SH-1-S', 'price': 10.0, 'stock_quantity': 2},
+             {'name': 'Medium', 'sku': 'SH-1-M', 'price': 10.0, 'stock_quantity': 5}]
+        )
+        self.assertTrue(result['success'], result)
+        self.product_id = result['product_id']
+        variations = self.controller.get_product_variations(self.product_id)['variations']
+        self.small_id, self.medium_id = (variation['id'] for variation in variations)
+    
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+    
+    def test_batch_is_written(self):
+        result = self.controller.bulk_update_stock([
+            {'variation_id': self.small_id, 'qty_change': 3},
+            {'variation_id': self.medium_id, 'qty_change': -1},
+            {'variation_id': self.small_id, 'qty_change': 1},
+            {'variation_id': 999999, 'qty_change': 1},
+            {'qty_change': 1}
+        ], user_id=1)
+        
+        self.assertTrue(result['success'], result)
+        self.assertEqual([row['new_quantity'] for row in result['results']], [5, 4, 6])
+        self.assertEqual(len(result['failed_updates']), 2)
+        
+        variations = self.controller.get_product_variations(self.product_id)['variations']
+        stocks = {variation['id']: variation['stock_quantity'] for variation in variations}
+        self.assertEqual(stocks, {self.small_id: 6, self.medium_id: 4})
+        
+        movements = self.db.execute_query(
+            "SELECT product_id, product_variation_id, balance_before, balance_after "
+            "FROM stock_movements ORDER BY id"
+        )
+        self.assertEqual(
+            [(row['product_id'], row['product_variation_id'], row['balance_before'], row['balance_after'])
+             for row in movements],
+            [(self.product_id, self.small_id, 2, 5),
+             (self.product_id, self.medium_id, 5, 4),
+             (self.product_id, self.small_id, 5, 6)]
+        )
+        
+        audit = self.db.execute_query(
+            "SELECT status FROM audit_logs WHERE entity_type = 'stock_movements'"
+        )
+        self.assertEqual([row['status'] for row in audit], ['partial'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -238,6 +238,11 @@ class TranslationManager:
             default_language: Default language code ('en' or 'ar')
         """
         self.current_language = default_language if default_language in self.TRANSLATIONS else 'ar'
+        
+        # Formatted text for keys with no translation, built once per key.
+        # Translated keys are always read from TRANSLATIONS, so language
+        # changes and edits to the dictionaries take effect immediately.
+        self._untranslated = {}
     
     def get(self, key: str) -> str:
         """
@@ -252,8 +257,30 @@ class TranslationManager:
         try:
             return self.TRANSLATIONS[self.current_language][key]
         except KeyError:
-            # If key not found, return the key formatted nicely
-            return key.replace('_', ' ').title()
+            return self._format_key(key)
+    
+    def get_many(self, keys) -> dict:
+        """
+        Get translated text for several keys at once.
+        
+        Args:
+            keys: Iterable of translation keys
+            
+        Returns:
+            Dictionary mapping each key to its translated text
+        """
+        translations = self.TRANSLATIONS.get(self.current_language, {})
+        return {
+            key: translations[key] if key in translations else self._format_key(key)
+            for key in keys
+        }
+    
+    def _format_key(self, key: str) -> str:
+        """Return the key formatted nicely, for keys with no translation."""
+        text = self._untranslated.get(key)
+        if text is None:
+            text = self._untranslated[key] = key.replace('_', ' ').title()
+        return text
     
     def set_language(self, lang_code: str) -> bool:
         """